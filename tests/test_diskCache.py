@@ -0,0 +1,41 @@
+import pytest
+
+from usgs_m2m.diskCache import DAY, DiskCache, parse_ingest_frequency
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('P1D', DAY),
+    ('P0Y0M1DT0H0M0.000S', DAY),
+    ('p7d', 7 * DAY),
+    ('P1W', 7 * DAY),
+    ('P1M', 30 * DAY),  # months before T
+    ('PT1M', 60),  # minutes after T
+    ('PT1H30M', 5400),
+    ('P1.5D', 1.5 * DAY),
+    (' P1Y ', 365 * DAY),
+    ('Daily', DAY),
+    ('WEEKLY', 7 * DAY),
+    ('monthly', 30 * DAY),
+])
+def test_parse_ingest_frequency(value, expected):
+    assert parse_ingest_frequency(value) == expected
+
+
+@pytest.mark.parametrize('value', [None, 1, '', 'P', 'PT', 'P0D', 'P0Y0M0DT0H0M0.000S', 'P1X', '1D', 'sometimes'])
+def test_parse_ingest_frequency_unknown(value):
+    assert parse_ingest_frequency(value) is None
+
+
+def test_ingest_frequency_shortens_ttl(tmp_path):
+    cache = DiskCache(str(tmp_path / 'cache.sqlite'))
+    try:
+        cache.set('dataset-search', 'hash', {'data': [{'datasetAlias': 'Hourly_Set', 'datasetId': '5e83d0b8',
+                                                       'ingestFrequency': 'PT1H'}]})
+        assert cache.ingest_frequency('hourly_set') == 3600
+        assert cache.ttl('scene-search', {'datasetName': 'HOURLY_SET'}) == 3600
+        assert cache.ttl('scene-search', {'datasetName': 'other'}) == DAY
+        assert cache.ttl('dataset', response={'data': {'ingestFrequency': 'P30D'}}) == 7 * DAY
+        assert cache.ttl('dataset', response={'data': {'ingestFrequency': 'P1D'}}) == DAY
+        assert cache.ttl('login') is None
+    finally:
+        cache.close()
@@ -0,0 +1,68 @@
+import pytest
+
+from usgs_m2m.clientErrors import PaginationError
+from usgs_m2m.usgsMethods import API
+
+
+def page(startingNumber: int, count: int, totalHits=100, nextRecord=None, accuracy='exact') -> dict:
+    return {'results': [{'entityId': f'E{startingNumber + i}'} for i in range(count)], 'totalHits': totalHits,
+            'totalHitsAccuracy': accuracy, 'startingNumber': startingNumber, 'recordsReturned': count,
+            'nextRecord': nextRecord}
+
+
+@pytest.mark.parametrize('data, startingNumber, page_size, expected', [
+    (page(1, 10, nextRecord=11), 1, 10, 11),  # full page
+    (page(1, 10), 1, 10, 11),  # no nextRecord
+    (page(1, 10, nextRecord=5), 1, 10, 11),  # nextRecord pointing back is ignored
+    (page(1, 10, nextRecord='11'), 1, 10, 11),  # nextRecord of the wrong type is ignored
+    (page(1, 8, nextRecord=11), 1, 10, 11),  # short page, but the server skipped records
+    (page(91, 10, nextRecord=101), 91, 10, None),  # past totalHits
+    (page(95, 6, nextRecord=101), 95, 10, None),  # short last page
+    (page(1, 0, nextRecord=1), 1, 10, None),  # no results
+    ({'results': None, 'totalHits': 0}, 1, 10, None),
+])
+def test_next_starting_number(data, startingNumber, page_size, expected):
+    assert API._next_starting_number(data, startingNumber, page_size) == expected
+
+
+def test_approximate_total_hits_does_not_end_the_walk():
+    data = page(91, 10, totalHits=100, nextRecord=101, accuracy='approximate')
+    assert API._next_starting_number(data, 91, 10) == 101
+    assert API._next_starting_number(dict(data, totalHitsAccuracy='exact'), 91, 10) is None
+
+
+def test_walk_visits_every_record_once():
+    totalHits, page_size, startingNumber, seen = 23, 5, 1, []
+    while startingNumber is not None:
+        data = page(startingNumber, min(page_size, totalHits - startingNumber + 1), totalHits=totalHits,
+                    nextRecord=startingNumber + page_size)
+        seen += [scene['entityId'] for scene in data['results']]
+        startingNumber = API._next_starting_number(data, startingNumber, page_size)
+    assert seen == [f'E{i}' for i in range(1, totalHits + 1)]
+
+
+@pytest.mark.parametrize('data, expected', [
+    (page(1, 10), True),
+    (page(1, 10, accuracy='approximate'), False),
+    (page(1, 10, totalHits=None), False),
+    (page(1, 0, totalHits=0), False),
+])
+def test_windows_known(data, expected):
+    assert API._windows_known(data) is expected
+
+
+def test_check_window_collects_entity_ids():
+    seen = {'E1', 'E2'}
+    API._check_window(page(3, 10, totalHits=12), 3, 10, 12, seen)  # last window is shorter
+    assert seen == {f'E{i}' for i in range(1, 13)}
+
+
+@pytest.mark.parametrize('data, message', [
+    (page(11, 10, totalHits=101), 'totalHits changed'),
+    (page(11, 9), 'holds 9 scenes instead of 10'),
+    (page(5, 10), 'repeats 6 scenes'),  # an unstable order shifted the window back
+])
+def test_check_window_rejects_inconsistent_windows(data, message):
+    seen = {f'E{i}' for i in range(1, 11)}
+    with pytest.raises(PaginationError, match=message):
+        API._check_window(data, 11, 10, 100, seen)
@@ -0,0 +1,102 @@
+import json
+
+import pytest
+
+from usgs_m2m.resultsStream import ResultsStream
+from usgs_m2m.usgsErrors import SERVER_ERROR
+
+SCENES = [{'entityId': 'LC80010012020001LGN00', 'cloudCover': 12.5, 'spatialCoverage': None, 'browse': []},
+          {'entityId': 'LC80010022020001LGN00', 'cloudCover': -1, 'displayId': 'café 東京 \U0001f6f0',
+           'options': {'bulk': True, 'download': False}},
+          {'entityId': 'LC80010032020001LGN00', 'cloudCover': 1e-07, 'displayId': 'quote " and \\ backslash'}]
+
+
+class FakeResponse:
+    """
+    Streamed response whose body arrives in chunks of `chunk_size` bytes.
+    """
+
+    def __init__(self, body: dict | str):
+        self.body = (body if isinstance(body, str) else json.dumps(body, ensure_ascii=False)).encode('utf-8')
+        self.closed = False
+
+    def iter_content(self, chunk_size: int):
+        for start in range(0, len(self.body), chunk_size):
+            yield self.body[start:start + chunk_size]
+
+    def close(self):
+        self.closed = True
+
+
+def search_response(results: list, errorCode=None, errorMessage=None) -> dict:
+    return {'requestId': 1, 'version': 'stable',
+            'data': {'recordsReturned': len(results), 'totalHits': 3, 'totalHitsAccuracy': 'exact',
+                     'results': results, 'nextRecord': 4, 'startingNumber': 1},
+            'errorCode': errorCode, 'errorMessage': errorMessage}
+
+
+@pytest.mark.parametrize('chunk_size', range(1, 65))
+def test_results_at_any_chunk_size(chunk_size):
+    response = FakeResponse(search_response(SCENES))
+    stream = ResultsStream(response, chunk_size=chunk_size)
+    assert stream.totalHits == 3
+    assert list(stream) == SCENES
+    assert stream.nextRecord == 4  # sent after the results
+    assert stream.header['requestId'] == 1
+    assert response.closed
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 64])
+def test_whitespace_between_tokens(chunk_size):
+    body = json.dumps(search_response(SCENES), indent=2, ensure_ascii=False).replace(':', ' :\r\n\t')
+    assert list(ResultsStream(FakeResponse(body), chunk_size=chunk_size)) == SCENES
+
+
+@pytest.mark.parametrize('chunk_size', [1, 5, 64])
+def test_empty_results(chunk_size):
+    response = FakeResponse(search_response([]))
+    stream = ResultsStream(response, chunk_size=chunk_size)
+    assert list(stream) == []
+    assert stream.recordsReturned == 0
+    assert response.closed
+
+
+@pytest.mark.parametrize('chunk_size', [1, 4, 64])
+def test_error_before_results(chunk_size):
+    body = search_response(SCENES, 'SERVER_ERROR', 'down')
+    response = FakeResponse({'errorCode': body.pop('errorCode'), 'errorMessage': body.pop('errorMessage'), **body})
+    with pytest.raises(SERVER_ERROR):
+        ResultsStream(response, chunk_size=chunk_size)
+    assert response.closed
+
+
+@pytest.mark.parametrize('chunk_size', [1, 4, 64])
+def test_error_after_results(chunk_size):
+    response = FakeResponse(search_response(SCENES, 'SERVER_ERROR', 'truncated'))
+    stream = ResultsStream(response, chunk_size=chunk_size)
+    with pytest.raises(SERVER_ERROR):
+        list(stream)
+    assert response.closed
+
+
+def test_response_without_data():
+    response = FakeResponse({'requestId': 1, 'data': None, 'errorCode': None, 'errorMessage': None})
+    stream = ResultsStream(response, chunk_size=3)
+    assert list(stream) == []
+    assert stream.header['data'] is None
+    assert response.closed
+
+
+@pytest.mark.parametrize('body', ['{"data": {"results": [1, 2', '{"data": {"results": [1 2]}}'])
+def test_malformed_body(body):
+    response = FakeResponse(body)
+    with pytest.raises(json.JSONDecodeError):
+        list(ResultsStream(response, chunk_size=2))
+    assert response.closed
+
+
+def test_close_on_early_exit():
+    response = FakeResponse(search_response(SCENES))
+    with ResultsStream(response, chunk_size=8) as stream:
+        assert next(stream) == SCENES[0]
+    assert response.closed
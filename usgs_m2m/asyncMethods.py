@@ -0,0 +1,389 @@
+"""
+Implementation date: 17.10.2026
+
+Asyncio flavour of `usgsMethods.API`. Every USGS method of `API` is available on `AsyncAPI` with the same name and
+parameters, but returns a coroutine (except `sceneSearchStream`, use `iter_scenes` instead):
+
+    async with AsyncAPI(max_concurrency=20) as api:
+        await api.loginToken('usgs_username', 'usgs_token')
+        tasks = [api.sceneMetadata(datasetName, entityId) for entityId in entityIds]
+        results = await asyncio.gather(*tasks)
+
+Requires the optional `httpx` package: pip install usgs_m2m[async]
+"""
+import asyncio
+import time
+from collections import deque
+from itertools import islice
+from typing import AsyncIterator, Iterable
+
+from .checkResponse import _check_response
+from .circuitBreaker import CircuitBreaker
+from .clientErrors import DeadlineExceeded, CircuitOpenError
+from .diskCache import DiskCache
+from .hedging import HedgePolicy
+from .jsonCodec import JsonCodec
+from .rateLimiter import RateLimiter
+from .responseCache import ResponseCache
+from .retryPolicy import RetryPolicy
+from .sceneMetadataCache import SceneMetadataCache
+from .sessionStore import SessionStore
+from .singleFlight import AsyncSingleFlight
+from .transports import HttpxResponse
+from .usgsErrors import INPUT_FORMAT
+from .usgsMethods import API, MapResult
+
+try:
+    import httpx
+except ImportError:  # optional dependency
+    httpx = None
+
+
+class _SyncOnly:
+    """
+    Removes a method of `API` that has no asynchronous counterpart: reading it on `AsyncAPI` raises AttributeError.
+    """
+
+    def __set_name__(self, owner, name: str):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        raise AttributeError(f'{self.name} is only available on the synchronous `API`, use `iter_scenes` instead')
+
+
+# noinspection PyPep8Naming
+class AsyncAPI(API):
+    """
+    Non-blocking client for the USGS/EROS Inventory Service Machine-to-Machine API.
+
+    One instance is meant to be shared by all tasks of an event loop: the API key is stored on the instance, concurrent
+    login calls are serialized and requests issued during a login wait for it to finish.
+    """
+    sceneSearchStream = _SyncOnly()  # streamed responses are parsed by the blocking `ResultsStream`
+
+    def __init__(self, max_concurrency: int = 10, json_codec: str | JsonCodec = 'json',
+                 retry_policy: RetryPolicy | None = None, rate_limiter: RateLimiter | None = None,
+                 circuit_breaker: CircuitBreaker | None = None, coalesce_requests: bool = True,
+                 hedging: HedgePolicy | None = None, http2: bool = False, session_store: SessionStore | None = None,
+                 response_cache: ResponseCache | None = None, disk_cache: DiskCache | None = None,
+                 scene_metadata_cache: SceneMetadataCache | None = None):
+        """
+        :param max_concurrency: (int) Maximum number of requests in flight at the same time
+        :param json_codec: (str | JsonCodec) See `API`
+        :param retry_policy: (RetryPolicy) See `API`
+        :param rate_limiter: (RateLimiter) See `API`
+        :param circuit_breaker: (CircuitBreaker) See `API`
+        :param coalesce_requests: (bool) See `API`
+        :param hedging: (HedgePolicy) See `API`
+        :param http2: (bool) See `API`
+        :param session_store: (SessionStore) See `API`
+        :param response_cache: (ResponseCache) See `API`
+        :param disk_cache: (DiskCache) See `API`
+        :param scene_metadata_cache: (SceneMetadataCache) See `API`, `get_many` needs a synchronous `API`
+        """
+        if httpx is None:
+            raise ImportError('AsyncAPI requires the `httpx` package: pip install httpx')
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._login_lock = asyncio.Lock()
+        super().__init__(pool_size=max_concurrency, json_codec=json_codec, retry_policy=retry_policy,
+                         rate_limiter=rate_limiter, circuit_breaker=circuit_breaker,
+                         coalesce_requests=coalesce_requests, hedging=hedging, http2=http2,
+                         session_store=session_store, response_cache=response_cache,
+                         disk_cache=disk_cache, scene_metadata_cache=scene_metadata_cache)
+        if self.single_flight is not None:
+            self.single_flight = AsyncSingleFlight()
+
+    def _create_session(self, pool_size: int) -> 'httpx.AsyncClient':
+        limits = httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+        return httpx.AsyncClient(http2=self.http2, limits=limits, timeout=None)
+
+    def __enter__(self):
+        raise TypeError('AsyncAPI is an asynchronous context manager, use `async with AsyncAPI() as api:`')
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """
+        Closes all pooled connections. The API key is not destroyed, call `logout` for that.
+        """
+        await self.session.aclose()
+
+    async def map(self, method_name: str, kwargs_iterable: Iterable[dict], max_workers: int | None = None,
+                  ordered: bool = True) -> AsyncIterator[MapResult]:
+        """
+        Asynchronous counterpart of `API.map`: an async generator of `MapResult`, with at most `max_workers` calls
+        (defaults to `max_concurrency`) in flight.
+        """
+        method = self._get_api_method(method_name)
+        max_workers = max_workers or self.max_concurrency
+        items = enumerate(kwargs_iterable)
+
+        def submit(count):
+            return [asyncio.ensure_future(self._map_call(method, index, kwargs))
+                    for index, kwargs in islice(items, count)]
+
+        tasks = deque(submit(max_workers)) if ordered else set(submit(max_workers))
+        try:
+            while tasks:
+                if ordered:
+                    result = await tasks.popleft()
+                    tasks.extend(submit(1))
+                    yield result
+                else:
+                    done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                    tasks.update(submit(len(done)))
+                    for task in done:
+                        yield task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    @staticmethod
+    async def _map_call(method, index: int, kwargs: dict) -> MapResult:
+        try:
+            return MapResult(index, kwargs, await method(**kwargs), None)
+        except Exception as error:
+            return MapResult(index, kwargs, None, error)
+
+    async def iter_scenes(self, datasetName: str, sceneFilter: dict | None = None, page_size: int = 5000,
+                          prefetch: bool = True, max_workers: int | None = None, deadline: float | None = None,
+                          **search_kwargs) -> AsyncIterator[dict]:
+        """
+        Asynchronous counterpart of `API.iter_scenes`: an async generator of scenes, the next page being requested in
+        a task while the current one is consumed, or `max_workers` pages at once.
+        """
+        async def page(startingNumber):
+            return (await self.sceneSearch(datasetName, maxResults=page_size, startingNumber=startingNumber,
+                                           sceneFilter=sceneFilter, deadline=deadline, **search_kwargs))['data'] or {}
+
+        data = await page(1)
+        if max_workers is not None and max_workers > 1 and self._windows_known(data):
+            async for scene in self._iter_scene_windows(data, page, max_workers):
+                yield scene
+            return
+        task = None
+        try:
+            startingNumber = 1
+            while True:
+                nextNumber = self._next_starting_number(data, startingNumber, page_size)
+                task = asyncio.ensure_future(page(nextNumber)) if prefetch and nextNumber else None
+                for scene in data.get('results') or []:
+                    yield scene
+                if nextNumber is None:
+                    return
+                data = await task if task is not None else await page(nextNumber)
+                task = None
+                startingNumber = nextNumber
+        finally:
+            if task is not None:
+                task.cancel()
+
+    async def _iter_scene_windows(self, first: dict, page, max_workers: int) -> AsyncIterator[dict]:
+        """
+        Asynchronous counterpart of `API._iter_scene_windows`, with at most `max_workers` pages in flight.
+        """
+        totalHits, window = first['totalHits'], len(first['results'])
+        starts = iter(range(1 + window, totalHits + 1, window))
+        seen = set()
+
+        def submit(count):
+            return [(startingNumber, asyncio.ensure_future(page(startingNumber)))
+                    for startingNumber in islice(starts, count)]
+
+        tasks = deque(submit(max_workers))
+        try:
+            startingNumber, data = 1, first
+            while True:
+                self._check_window(data, startingNumber, window, totalHits, seen)
+                for scene in data['results']:
+                    yield scene
+                if not tasks:
+                    return
+                startingNumber, task = tasks.popleft()
+                data = await task
+                tasks.extend(submit(1))
+        finally:
+            for _, task in tasks:
+                task.cancel()
+
+    async def _wait_for_login(self):
+        if self._login_lock.locked():
+            async with self._login_lock:
+                pass
+
+    def _httpx_timeout(self, url: str, expiry: float | None) -> 'httpx.Timeout':
+        connect, read = self._timeout(url, expiry)
+        return httpx.Timeout(read, connect=connect)
+
+    async def _post(self, url: str, json_payload: dict | None = None, auth: bool = True,
+                    expiry: float | None = None) -> dict:
+        body = self._encode_payload(url, json_payload)
+        headers = self._headers(auth)
+        if self._should_compress(url, body):
+            compressed_body, compressed_headers = self._compressed_request(body, headers)
+            async with self._semaphore:
+                response = await self.session.post(url, content=compressed_body, headers=compressed_headers,
+                                                   timeout=self._httpx_timeout(url, expiry))
+            if response.status_code not in self.compression_rejected_statuses:
+                try:
+                    return _check_response(HttpxResponse(response), self.json_codec.loads)
+                except INPUT_FORMAT:
+                    pass
+            content = await self._send_uncompressed(url, body, headers, expiry)
+            self.uncompressed_endpoints.add(self._endpoint(url))
+            return content
+        return await self._send_uncompressed(url, body, headers, expiry)
+
+    async def _send_uncompressed(self, url: str, body: bytes | None, headers: dict, expiry: float | None) -> dict:
+        async with self._semaphore:
+            response = await self.session.post(url, content=body, headers=headers,
+                                               timeout=self._httpx_timeout(url, expiry))
+        return _check_response(HttpxResponse(response), self.json_codec.loads)  # requests.HTTPError like `API`
+
+    async def _post_with_retries(self, url: str, json_payload: dict | None = None, auth: bool = True,
+                                 expiry: float | None = None) -> dict:
+        endpoint = self._endpoint(url)
+        attempt = 1
+        renewed = False
+        while True:
+            api_key = self.apiKey
+            try:
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.before_request(endpoint)
+                await self._admit(endpoint, json_payload, expiry)
+                content = await self._post(url, json_payload, auth, expiry)
+            except CircuitOpenError:
+                raise
+            except Exception as error:
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record(endpoint, error)  # also releases a half-open probe before a replay
+                if not renewed and self._can_renew(error, auth):
+                    await self._renew(api_key, expiry)
+                    renewed = True
+                    continue
+                delay = self.retry_policy.next_delay(endpoint, error, attempt, expiry)
+                if delay is None:
+                    raise
+                if self.loud_mode:
+                    print(f'Attempt {attempt} of {endpoint} failed ({error!r}), retrying in {delay:.1f} s')
+                await asyncio.sleep(delay)
+                attempt += 1
+            else:
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record(endpoint)
+                if self.rate_limiter is not None:
+                    self.rate_limiter.observe(endpoint, content)
+                if (auth and self._session_identity is not None
+                        and self.session_store.touch_due(self._session_identity)):
+                    await asyncio.to_thread(self.session_store.touch, self._session_identity, self.apiKey)
+                return content
+
+    async def _renew(self, expired_key: str | None, expiry: float | None = None):
+        async with self._login_lock:
+            if self.apiKey != expired_key or await self._run_store_io(self._load_renewed_key, expired_key):
+                return
+            url, json_payload = self._login_request
+            content = await self._post_with_retries(url, json_payload, auth=False, expiry=expiry)
+            self.apiKey = content['data']
+            await self._run_store_io(self._remember_login, url, json_payload)
+        if self.loud_mode:
+            print(f'API key renewed: {self.apiKey}')
+
+    async def _admit(self, endpoint: str, json_payload: dict | None, expiry: float | None):
+        if self.rate_limiter is None:
+            return
+        delay = self.rate_limiter.reserve(endpoint, json_payload)
+        if delay > 0:
+            if expiry is not None and time.monotonic() + delay >= expiry:
+                raise DeadlineExceeded(f'Deadline exceeded while waiting for the rate limiter ({endpoint})')
+            await asyncio.sleep(delay)
+
+    async def _calibrate_rate_limits(self, endpoint: str, expiry: float | None = None):
+        if not self._calibration_due(endpoint):
+            return
+        try:
+            await self.rateLimitSummary(deadline=self._remaining(expiry))
+        except Exception as error:
+            if self.loud_mode:
+                print(f'Rate limits calibration failed: {error!r}')
+
+    def _has_file_caches(self) -> bool:
+        return self.disk_cache is not None or (self.scene_metadata_cache is not None
+                                               and self.scene_metadata_cache.path is not None)
+
+    async def _run_cache_io(self, function, *args):
+        """
+        Calls a cache lookup or update in a worker thread when a cache is stored in SQLite (`disk_cache`, persisted
+        `scene_metadata_cache`), so that queries and lock waits do not block the event loop. In-memory caches are
+        used directly.
+        """
+        if self._has_file_caches():
+            return await asyncio.to_thread(function, *args)
+        return function(*args)
+
+    async def _run_store_io(self, function, *args):
+        """
+        Calls a login helper reading or writing `session_store` (file lock and JSON file) in a worker thread, so that
+        it does not block the event loop.
+        """
+        if self.session_store is not None:
+            return await asyncio.to_thread(function, *args)
+        return function(*args)
+
+    async def _send_request_and_check_it(self, url: str, json_payload: dict, deadline: float | None = None) -> dict:
+        expiry = self._expiry(url, deadline)
+        await self._wait_for_login()
+        endpoint = self._endpoint(url)
+        await self._calibrate_rate_limits(endpoint, expiry)
+        if endpoint not in self.read_only_endpoints:
+            return await self._post_with_retries(url, json_payload, expiry=expiry)
+        request_hash = self._request_hash(json_payload)
+        content = await self._run_cache_io(self._cached_response, endpoint, request_hash, json_payload)
+        if content is not None:
+            return content
+
+        async def call():
+            try:
+                if self.hedging is not None and endpoint in self.hedging.endpoints:
+                    content = await self.hedging.run_async(endpoint,
+                                                           lambda: self._post_with_retries(url, json_payload,
+                                                                                           expiry=expiry),
+                                                           timeout=self._remaining(expiry))
+                else:
+                    content = await self._post_with_retries(url, json_payload, expiry=expiry)
+            except Exception as error:
+                self._cache_error(endpoint, request_hash, json_payload, error)
+                raise
+            await self._run_cache_io(self._cache_response, endpoint, request_hash, json_payload, content)
+            return content
+
+        if self.single_flight is None:
+            return await call()
+        return await self.single_flight.do(f'{endpoint}:{request_hash}', call, timeout=self._remaining(expiry))
+
+    async def _login(self, url: str, json_payload: dict, deadline: float | None = None) -> dict:
+        expiry = self._expiry(url, deadline)
+        content = await self._run_store_io(self._stored_login, url, json_payload)
+        if content is not None:
+            return content
+        async with self._login_lock:
+            content = await self._post_with_retries(url, json_payload, auth=False, expiry=expiry)
+            self.apiKey = content['data']
+            await self._run_store_io(self._remember_login, url, json_payload)
+        if self.loud_mode:
+            print(f'Login successful. API key: {self.apiKey}')
+        return content
+
+    async def _logout(self, url: str, deadline: float | None = None) -> dict:
+        expiry = self._expiry(url, deadline)
+        await self._wait_for_login()
+        content = await self._post_with_retries(url, expiry=expiry)
+        await self._run_store_io(self._forget_login)
+        if self.loud_mode:
+            print(f'Logout successful. API key destroyed: {self.apiKey}')
+        return content
@@ -1,11 +1,25 @@
+import json as json_module
 import requests
 from .usgsErrors import *
 
 
-def _check_response(response):
+def _check_response(response, loads=json_module.loads) -> dict:
+    """
+    Checks the response and decodes its body exactly once.
+    :param response: HTTP response
+    :param loads: function used to decode the JSON body
+    :return: (dict) Decoded response
+    """
     _check_if_response_is_none(response)
-    _check_http_response(response)
-    _check_usgs_error(response)
+    http_ok = _check_http_response(response)
+    try:
+        json = loads(response.content)
+    except ValueError:
+        if not http_ok:  # error page instead of a USGS error
+            response.raise_for_status()
+        raise
+    _check_usgs_error(json)
+    return json
 
 
 def _check_if_response_is_none(response):
@@ -31,8 +45,7 @@ def _check_http_response(response):
         print(response)
 
 
-def _check_usgs_error(response):
-    json = response.json()
+def _check_usgs_error(json):
     errorCode = json['errorCode']
     errorMessage = json['errorMessage']
 
@@ -0,0 +1,129 @@
+"""
+Implementation date: 17.10.2026
+
+Per-endpoint circuit breaker: once an endpoint keeps failing, requests to it fail fast with `CircuitOpenError` for a
+cooldown period instead of waiting for timeouts. After the cooldown a single probe request is let through: if it
+succeeds the circuit is closed again, otherwise it stays open for another cooldown.
+"""
+import threading
+import time
+
+import requests
+
+from .clientErrors import CircuitOpenError, DeadlineExceeded
+from .usgsErrors import ENDPOINT_UNAVAILABLE, SERVER_ERROR, SEARCH_UNAVAILABLE
+
+try:
+    import httpx
+except ImportError:  # optional dependency
+    httpx = None
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half-open'
+
+
+class Circuit:
+    """
+    State of one endpoint.
+    """
+
+    def __init__(self):
+        self.state = CLOSED
+        self.failures = 0  # consecutive failures
+        self.opened_at = None  # `time.monotonic()` value
+        self.probe_in_flight = False
+
+
+class CircuitBreaker:
+    """
+    Failures are HTTP 5xx responses, connection errors (also resets while the body is read), timeouts and the USGS
+    errors ENDPOINT_UNAVAILABLE, SERVER_ERROR and SEARCH_UNAVAILABLE. Any other outcome, such as NOT_FOUND or
+    INPUT_INVALID, proves that the endpoint is up.
+    """
+    failure_errors = (ENDPOINT_UNAVAILABLE, SERVER_ERROR, SEARCH_UNAVAILABLE,
+                      requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                      requests.exceptions.ChunkedEncodingError, requests.exceptions.ContentDecodingError)
+    if httpx is not None:
+        failure_errors += (httpx.TransportError, httpx.DecodingError)
+    neutral_errors = (DeadlineExceeded,)  # the request may not have been sent at all
+
+    def __init__(self, failure_threshold: int = 5, cooldown: float = 30.0):
+        """
+        :param failure_threshold: (int) Number of consecutive failures that opens the circuit of an endpoint
+        :param cooldown: (float) Seconds during which an open circuit fails fast before letting a probe through
+        """
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.circuits = {}  # endpoint -> Circuit
+        self._lock = threading.Lock()
+
+    def _circuit(self, endpoint: str) -> Circuit:
+        if endpoint not in self.circuits:
+            self.circuits[endpoint] = Circuit()
+        return self.circuits[endpoint]
+
+    def states(self) -> dict:
+        """
+        :return: (dict) Endpoint path -> 'closed', 'open' or 'half-open', for every endpoint called so far
+        """
+        with self._lock:
+            return {endpoint: circuit.state for endpoint, circuit in self.circuits.items()}
+
+    def before_request(self, endpoint: str):
+        """
+        :param endpoint: (str) Endpoint path, e.g. 'scene-search'
+        :raise CircuitOpenError: if the circuit is open, or half-open with its probe already in flight
+        """
+        with self._lock:
+            circuit = self._circuit(endpoint)
+            if circuit.state == CLOSED:
+                return
+            if circuit.state == OPEN:
+                remaining = circuit.opened_at + self.cooldown - time.monotonic()
+                if remaining > 0:
+                    raise CircuitOpenError(f'Circuit of {endpoint} is open, next probe in {remaining:.1f} s')
+                circuit.state = HALF_OPEN
+            if circuit.probe_in_flight:
+                raise CircuitOpenError(f'Circuit of {endpoint} is half-open and its probe is in flight')
+            circuit.probe_in_flight = True
+
+    def record(self, endpoint: str, error: Exception | None = None):
+        """
+        Records the outcome of a request let through by `before_request`.
+        :param endpoint: (str) Endpoint path
+        :param error: (Exception) Error raised by the request, None if it succeeded
+        """
+        with self._lock:
+            circuit = self._circuit(endpoint)
+            circuit.probe_in_flight = False
+            if isinstance(error, self.neutral_errors):
+                if circuit.state == HALF_OPEN:
+                    circuit.state = OPEN  # the probe told nothing, let the next caller probe
+                return
+            if self.is_failure(error):
+                circuit.failures += 1
+                if circuit.state == HALF_OPEN or circuit.failures >= self.failure_threshold:
+                    circuit.state = OPEN
+                    circuit.opened_at = time.monotonic()
+            else:
+                circuit.state = CLOSED
+                circuit.failures = 0
+
+    def is_failure(self, error: Exception | None) -> bool:
+        if error is None:
+            return False
+        if isinstance(error, self.failure_errors):
+            return True
+        response = getattr(error, 'response', None)  # requests.HTTPError, httpx.HTTPStatusError
+        return response is not None and response.status_code >= 500
+
+    def reset(self, endpoint: str | None = None):
+        """
+        Closes the circuit of an endpoint, or of all endpoints if `endpoint` is None.
+        """
+        with self._lock:
+            if endpoint is None:
+                self.circuits.clear()
+            else:
+                self.circuits.pop(endpoint, None)
@@ -0,0 +1,21 @@
+"""
+Implementation date: 17.10.2026
+
+Errors raised by the client itself, not by the USGS API (see `usgsErrors` for those).
+"""
+
+
+class DeadlineExceeded(TimeoutError):
+    pass
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+class RecordingNotFound(LookupError):
+    pass
+
+
+class PaginationError(RuntimeError):
+    pass
@@ -0,0 +1,233 @@
+"""
+Implementation date: 17.10.2026
+
+Local registry of the datasets of the USGS catalogs, built from `datasetSearch` and `datasetCategories` and saved to
+disk, so that dataset names, aliases and ids are resolved without a request:
+
+    registry = DatasetRegistry()  # loads ~/.usgs_m2m/datasets.json
+    registry.refresh(api)  # only sends requests if the catalog was not refreshed during the last day
+    registry.alias('Landsat 8-9 OLI/TIRS C2 L1')  # 'landsat_ot_c2_l1'
+    registry.ingest_frequency('landsat_ot_c2_l1')  # seconds
+    registry.filters(api, 'landsat_ot_c2_l1').value('WRS Path', '145')  # `MetadataValue` filter, see `FilterIndex`
+"""
+import json
+import os
+import tempfile
+import threading
+import time
+
+from .diskCache import parse_ingest_frequency
+from .filterIndex import FilterIndex
+
+DAY = 24 * 60 * 60
+
+
+class DatasetRegistry:
+    """
+    Datasets are stored by `datasetId` and indexed (case-insensitively) by id, alias and collection name. The metadata
+    filter fields of a dataset are compiled on first use by `filters` and saved with it.
+    """
+    kept_fields = ('datasetId', 'datasetAlias', 'collectionName', 'collectionLongName', 'datasetCategoryName',
+                   'dataOwner', 'dateUpdated', 'ingestFrequency', 'spatialBounds', 'temporalCoverage',
+                   'acquisitionStart', 'acquisitionEnd', 'supportCloudCover', 'supportDeletionSearch')
+    index_fields = ('datasetId', 'datasetAlias', 'collectionName', 'collectionLongName')
+    default_path = os.path.join(os.path.expanduser('~'), '.usgs_m2m', 'datasets.json')
+
+    def __init__(self, path: str | None = None, max_age: float = DAY):
+        """
+        :param path: (str) Path of the registry file, defaults to `~/.usgs_m2m/datasets.json`. Loaded if it exists
+        :param max_age: (float) Seconds after which `refresh` requests a catalog again
+        """
+        self.path = path or self.default_path
+        self.max_age = max_age
+        self.datasets = {}  # datasetId -> dataset
+        self.refreshed = {}  # catalog -> time.time() of its last refresh
+        self.filter_fields = {}  # datasetId -> {'refreshed': time.time(), 'fields': [fields of `FilterIndex`]}
+        self._filter_indexes = {}  # datasetId -> FilterIndex
+        self._index = {}  # lowercase id, alias or collection name -> datasetId
+        self._lock = threading.RLock()
+        self.load()
+
+    def __len__(self) -> int:
+        return len(self.datasets)
+
+    def __contains__(self, dataset: str) -> bool:
+        return self.get(dataset) is not None
+
+    def load(self):
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                content = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return
+        with self._lock:
+            self.datasets = content.get('datasets', {})
+            self.refreshed = content.get('refreshed', {})
+            self.filter_fields = content.get('filterFields', {})
+            self._filter_indexes = {}
+            self._reindex()
+
+    def save(self):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            content = {'datasets': self.datasets, 'refreshed': self.refreshed, 'filterFields': self.filter_fields}
+            fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(content, f)
+                os.replace(temp_path, self.path)
+            except BaseException:
+                os.remove(temp_path)
+                raise
+
+    def _reindex(self):
+        self._index = {}
+        for dataset_id, dataset in self.datasets.items():
+            for field in self.index_fields:
+                if isinstance(dataset.get(field), str):
+                    self._index[dataset[field].lower()] = dataset_id
+
+    def update(self, datasets: list, catalog: str | None = None) -> int:
+        """
+        Adds or replaces datasets, e.g. from the 'data' of a `datasetSearch` or `dataset` response.
+        :param datasets: (list) Dataset dictionaries
+        :param catalog: (str) Catalog the datasets were listed in
+        :return: (int) Number of datasets added or changed
+        """
+        changed = 0
+        with self._lock:
+            for dataset in datasets:
+                dataset_id = dataset.get('datasetId')
+                if not dataset_id:
+                    continue
+                previous = self.datasets.get(dataset_id, {})
+                record = {field: dataset[field] for field in self.kept_fields if field in dataset}
+                record['datasetCategoryName'] = record.get('datasetCategoryName', previous.get('datasetCategoryName'))
+                record['catalogs'] = sorted(set(previous.get('catalogs', [])) | ({catalog} if catalog else set()))
+                if record != previous:
+                    self.datasets[dataset_id] = record
+                    changed += 1
+                    for field in self.index_fields:
+                        if isinstance(record.get(field), str):
+                            self._index[record[field].lower()] = dataset_id
+        return changed
+
+    def refresh(self, api, catalog: str = 'EE', force: bool = False) -> int:
+        """
+        Requests the datasets of a catalog with `datasetSearch` and their categories with `datasetCategories` if the
+        catalog was not refreshed during the last `max_age` seconds, then saves the registry. Datasets that are no
+        longer listed in the catalog are removed from it.
+        :param api: (API) Logged-in `API` instance
+        :param catalog: (str) Catalog to refresh: 'EE', 'GV', 'HDDS', 'LPCS'
+        :param force: (bool) Refresh even if the catalog is recent
+        :return: (int) Number of datasets added, changed or removed
+        """
+        if not force and time.time() - self.refreshed.get(catalog, 0) < self.max_age:
+            return 0
+        datasets = api.datasetSearch(catalog=catalog)['data'] or []
+        categories = {}
+        for dataset, category_name in self._walk_categories(api.datasetCategories(catalog)['data']):
+            categories[dataset.get('datasetId')] = category_name
+        datasets = [{**dataset, 'datasetCategoryName': categories[dataset['datasetId']]}
+                    if dataset.get('datasetId') in categories else dataset for dataset in datasets]  # responses may be cached
+        with self._lock:
+            changed = self.update(datasets, catalog)
+            listed = {dataset.get('datasetId') for dataset in datasets}
+            for dataset_id, dataset in list(self.datasets.items()):
+                if catalog in dataset.get('catalogs', []) and dataset_id not in listed:
+                    dataset['catalogs'].remove(catalog)
+                    if not dataset['catalogs']:
+                        del self.datasets[dataset_id]
+                    changed += 1
+            self._reindex()
+            self.refreshed[catalog] = time.time()
+            self.save()
+        return changed
+
+    @staticmethod
+    def _walk_categories(data, category_name: str | None = None):
+        """
+        Yields (dataset, category name) for every dataset nested in a `datasetCategories` response.
+        """
+        if isinstance(data, list):
+            for item in data:
+                yield from DatasetRegistry._walk_categories(item, category_name)
+        elif isinstance(data, dict):
+            if 'datasetId' in data and 'datasetAlias' in data:
+                yield data, category_name
+                return
+            category_name = data.get('categoryName', category_name)
+            for value in data.values():
+                if isinstance(value, (list, dict)):
+                    yield from DatasetRegistry._walk_categories(value, category_name)
+
+    def get(self, dataset: str) -> dict | None:
+        """
+        :param dataset: (str) Dataset id, alias (datasetName) or collection name, case-insensitive
+        :return: (dict) Dataset, None if it is unknown
+        """
+        if not isinstance(dataset, str):
+            return None
+        dataset_id = self._index.get(dataset.lower())
+        return self.datasets.get(dataset_id) if dataset_id is not None else None
+
+    def resolve(self, dataset: str) -> dict:
+        """
+        Same as `get`, but raises KeyError for an unknown dataset.
+        """
+        record = self.get(dataset)
+        if record is None:
+            raise KeyError(f'Unknown dataset: {dataset}. Call `refresh` or check the name')
+        return record
+
+    def alias(self, dataset: str) -> str:
+        """
+        :return: (str) `datasetAlias`, the value expected by the `datasetName` parameters
+        """
+        return self.resolve(dataset)['datasetAlias']
+
+    def id(self, dataset: str) -> str:
+        """
+        :return: (str) `datasetId`
+        """
+        return self.resolve(dataset)['datasetId']
+
+    def ingest_frequency(self, dataset: str) -> float | None:
+        """
+        :return: (float) Ingest period in seconds, None if it is unknown
+        """
+        return parse_ingest_frequency(self.resolve(dataset).get('ingestFrequency'))
+
+    def coverage(self, dataset: str) -> dict:
+        """
+        :return: (dict) {'spatialBounds': ..., 'temporalCoverage': ...} of the dataset
+        """
+        record = self.resolve(dataset)
+        temporal = record.get('temporalCoverage')
+        if temporal is None and ('acquisitionStart' in record or 'acquisitionEnd' in record):
+            temporal = {'startDate': record.get('acquisitionStart'), 'endDate': record.get('acquisitionEnd')}
+        return {'spatialBounds': record.get('spatialBounds'), 'temporalCoverage': temporal}
+
+    def filters(self, api, dataset: str, force: bool = False) -> FilterIndex:
+        """
+        :param api: (API) Logged-in `API` instance, only used if the fields are unknown or older than `max_age`
+        :param dataset: (str) Dataset id, alias or collection name
+        :param force: (bool) Request the fields again with `datasetFilters`
+        :return: (FilterIndex) Metadata filter fields of the dataset
+        """
+        record = self.get(dataset)
+        key = record['datasetId'] if record is not None else dataset.lower()
+        with self._lock:
+            cached = self.filter_fields.get(key)
+            if not force and cached is not None and time.time() - cached['refreshed'] < self.max_age:
+                if key not in self._filter_indexes:
+                    self._filter_indexes[key] = FilterIndex(cached['fields'])
+                return self._filter_indexes[key]
+        dataset_name = record['datasetAlias'] if record is not None else dataset
+        index = FilterIndex(api.datasetFilters(dataset_name)['data'] or [])
+        with self._lock:
+            self.filter_fields[key] = {'refreshed': time.time(), 'fields': index.fields}
+            self._filter_indexes[key] = index
+            self.save()
+        return index
@@ -0,0 +1,216 @@
+"""
+Implementation date: 17.10.2026
+
+Persistent response cache in a SQLite database, shared by all the processes of a machine and kept across reruns:
+
+    api = API(disk_cache=DiskCache())  # ~/.usgs_m2m/cache.sqlite
+    api.sceneSearch('landsat_ot_c2_l1', maxResults=10000, startingNumber=1)  # request
+    api.sceneSearch('landsat_ot_c2_l1', maxResults=10000, startingNumber=1)  # served from the disk, also by reruns
+
+Entries of a dataset expire after its `ingestFrequency` (read from the `dataset`, `datasetSearch` and
+`datasetCategories` responses that go through the cache) if that is shorter than the TTL of the endpoint.
+"""
+import os
+import re
+import sqlite3
+import threading
+import time
+
+from .jsonCodec import JsonCodec
+
+DAY = 24 * 60 * 60
+_DURATION = re.compile(r'^P(?:(?P<Y>[\d.]+)Y)?(?:(?P<M>[\d.]+)M)?(?:(?P<W>[\d.]+)W)?(?:(?P<D>[\d.]+)D)?'
+                       r'(?:T(?:(?P<h>[\d.]+)H)?(?:(?P<m>[\d.]+)M)?(?:(?P<s>[\d.]+)S)?)?$')
+_DURATION_SECONDS = {'Y': 365 * DAY, 'M': 30 * DAY, 'W': 7 * DAY, 'D': DAY, 'h': 3600, 'm': 60, 's': 1}
+_FREQUENCY_WORDS = {'hourly': 3600, 'daily': DAY, 'weekly': 7 * DAY, 'monthly': 30 * DAY, 'quarterly': 91 * DAY,
+                    'yearly': 365 * DAY, 'annually': 365 * DAY}
+
+
+def parse_ingest_frequency(value) -> float | None:
+    """
+    :param value: `ingestFrequency` of a dataset: ISO 8601 duration ('P1D', 'P0Y0M1DT0H0M0.000S') or a word ('Daily')
+    :return: (float) Ingest period in seconds, None if it is unknown or zero
+    """
+    if not isinstance(value, str):
+        return None
+    value = value.strip()
+    match = _DURATION.match(value.upper())
+    if match and value.upper() != 'P':
+        seconds = sum(float(number) * _DURATION_SECONDS[unit] for unit, number in match.groupdict().items() if number)
+    else:
+        seconds = _FREQUENCY_WORDS.get(value.lower())
+    return seconds or None
+
+
+class DiskCache:
+    """
+    SQLite cache of successful responses keyed by endpoint and request hash, safe to share between threads and
+    processes (WAL journal, one connection per thread). Only the endpoints of `ttls` are cached.
+    """
+    default_ttls = {'dataset': 7 * DAY,  # seconds, shortened to the ingest frequency of the dataset when known
+                    'dataset-bulk-products': 7 * DAY,
+                    'dataset-catalogs': DAY,
+                    'dataset-categories': DAY,
+                    'dataset-download-options': 7 * DAY,
+                    'dataset-file-groups': 7 * DAY,
+                    'dataset-filters': 7 * DAY,
+                    'dataset-search': DAY,
+                    'grid2ll': 365 * DAY,
+                    'scene-metadata': DAY,  # ingest frequencies are only known for the datasets seen by the cache
+                    'scene-metadata-xml': DAY,
+                    'scene-search': DAY,
+                    }
+    dataset_endpoints = {'dataset', 'dataset-search', 'dataset-categories'}  # responses describing datasets
+    default_path = os.path.join(os.path.expanduser('~'), '.usgs_m2m', 'cache.sqlite')
+
+    def __init__(self, path: str | None = None, ttls: dict | None = None, timeout: float = 30):
+        """
+        :param path: (str) Path of the database, defaults to `~/.usgs_m2m/cache.sqlite`
+        :param ttls: (dict) Endpoint -> time to live in seconds, defaults to `default_ttls`
+        :param timeout: (float) Seconds to wait for a lock held by another process
+        """
+        self.path = path or self.default_path
+        self.ttls = dict(self.default_ttls if ttls is None else ttls)
+        self.timeout = timeout
+        self.codec = JsonCodec()
+        self.hits = {}
+        self.misses = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with self._connection() as connection:
+            connection.execute('CREATE TABLE IF NOT EXISTS responses (endpoint TEXT NOT NULL, request_hash TEXT NOT '
+                               'NULL, expires REAL NOT NULL, body BLOB NOT NULL, PRIMARY KEY (endpoint, request_hash))')
+            connection.execute('CREATE TABLE IF NOT EXISTS ingest_frequencies (dataset TEXT PRIMARY KEY, '
+                               'seconds REAL NOT NULL)')
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=self.timeout)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._local.connection = connection
+        return connection
+
+    def close(self):
+        """
+        Closes the connection of the calling thread.
+        """
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def _count(self, counters: dict, endpoint: str):
+        with self._lock:
+            counters[endpoint] = counters.get(endpoint, 0) + 1
+
+    def get(self, endpoint: str, request_hash: str) -> dict | None:
+        """
+        :param endpoint: (str) Endpoint path, e.g. 'scene-search'
+        :param request_hash: (str) Hash of the request (payload, apiURL and user), see `API._request_hash`
+        :return: (dict) Cached response, None if there is none or it has expired
+        """
+        if endpoint not in self.ttls:
+            return None
+        row = self._connection().execute('SELECT body FROM responses WHERE endpoint = ? AND request_hash = ? AND '
+                                         'expires > ?', (endpoint, request_hash, time.time())).fetchone()
+        if row is None:
+            self._count(self.misses, endpoint)
+            return None
+        self._count(self.hits, endpoint)
+        return self.codec.loads(row[0])
+
+    def set(self, endpoint: str, request_hash: str, response: dict, json_payload: dict | None = None):
+        """
+        Stores a response, and the ingest frequencies of the datasets it describes.
+        :param json_payload: (dict) Request payload, its dataset shortens the TTL to the dataset ingest frequency
+        """
+        if endpoint in self.dataset_endpoints:
+            self._record_ingest_frequencies(response.get('data'))
+        ttl = self.ttl(endpoint, json_payload, response)
+        if ttl is None:
+            return
+        with self._connection() as connection:
+            connection.execute('INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)',
+                               (endpoint, request_hash, time.time() + ttl, self.codec.dumps(response)))
+
+    def ttl(self, endpoint: str, json_payload: dict | None = None, response: dict | None = None) -> float | None:
+        """
+        :return: (float) Time to live in seconds of a response, None if the endpoint is not cached
+        """
+        ttl = self.ttls.get(endpoint)
+        if ttl is None or ttl <= 0:
+            return None
+        frequency = None
+        if endpoint == 'dataset' and response is not None and isinstance(response.get('data'), dict):
+            frequency = parse_ingest_frequency(response['data'].get('ingestFrequency'))
+        elif json_payload:
+            frequency = self.ingest_frequency(json_payload.get('datasetName') or json_payload.get('datasetId'))
+        return min(ttl, frequency) if frequency else ttl
+
+    def ingest_frequency(self, dataset: str | None) -> float | None:
+        """
+        :param dataset: (str) Dataset name, alias or id
+        :return: (float) Ingest period of the dataset in seconds, None if it is unknown
+        """
+        if not isinstance(dataset, str):
+            return None
+        row = self._connection().execute('SELECT seconds FROM ingest_frequencies WHERE dataset = ?',
+                                         (dataset.lower(),)).fetchone()
+        return row[0] if row else None
+
+    def _record_ingest_frequencies(self, data):
+        frequencies = {}
+        stack = [data]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, list):
+                stack.extend(item)
+            elif isinstance(item, dict):
+                seconds = parse_ingest_frequency(item.get('ingestFrequency'))
+                if seconds:
+                    for field in ('datasetAlias', 'datasetId', 'collectionName'):
+                        if isinstance(item.get(field), str):
+                            frequencies[item[field].lower()] = seconds
+                stack.extend(value for value in item.values() if isinstance(value, (list, dict)))
+        if frequencies:
+            with self._connection() as connection:
+                connection.executemany('INSERT OR REPLACE INTO ingest_frequencies VALUES (?, ?)',
+                                       frequencies.items())
+
+    def invalidate(self, endpoint: str | None = None, request_hash: str | None = None):
+        """
+        Drops the cached responses of an endpoint (one request if `request_hash` is given), or of all endpoints if
+        `endpoint` is None.
+        """
+        with self._connection() as connection:
+            if endpoint is None:
+                connection.execute('DELETE FROM responses')
+            elif request_hash is not None:
+                connection.execute('DELETE FROM responses WHERE endpoint = ? AND request_hash = ?',
+                                   (endpoint, request_hash))
+            else:
+                connection.execute('DELETE FROM responses WHERE endpoint = ?', (endpoint,))
+
+    def purge(self) -> int:
+        """
+        Deletes the expired responses.
+        :return: (int) Number of responses deleted
+        """
+        with self._connection() as connection:
+            return connection.execute('DELETE FROM responses WHERE expires <= ?', (time.time(),)).rowcount
+
+    def stats(self) -> dict:
+        """
+        :return: (dict) Endpoint -> {'hits': ..., 'misses': ..., 'entries': ...}, counts of this process except
+                 'entries'
+        """
+        rows = self._connection().execute('SELECT endpoint, COUNT(*) FROM responses WHERE expires > ? '
+                                          'GROUP BY endpoint', (time.time(),)).fetchall()
+        entries = dict(rows)
+        with self._lock:
+            return {endpoint: {'hits': self.hits.get(endpoint, 0), 'misses': self.misses.get(endpoint, 0),
+                               'entries': entries.get(endpoint, 0)}
+                    for endpoint in sorted(set(self.hits) | set(self.misses) | set(entries))}
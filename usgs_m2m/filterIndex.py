@@ -0,0 +1,108 @@
+"""
+Implementation date: 17.10.2026
+
+Index of the metadata filter fields of a dataset (the `datasetFilters` response), to build `MetadataValue` and
+`MetadataBetween` filters by field name instead of by the opaque `filterId`:
+
+    filters = registry.filters(api, 'landsat_ot_c2_l1')  # cached with the `DatasetRegistry`
+    metadataFilter = filters.all(filters.value('WRS Path', '145'),
+                                 filters.between('Land Cloud Cover', 0, 20))
+    sceneFilter = SceneFilter(metadataFilter=metadataFilter, ...).dict
+"""
+import re
+
+from .usgsDataTypes import MetadataAnd, MetadataBetween, MetadataOr, MetadataValue
+
+_SQL_NAME = re.compile(r'^\s*([A-Za-z_][\w.]*)')
+
+
+class FilterIndex:
+    """
+    Fields are looked up case-insensitively by label ('Land Cloud Cover'), SQL name ('LAND_CLOUD_COVER'), legacy field
+    id or filter id. Each field is a dictionary: {'filterId', 'fieldLabel', 'sqlName', 'type', 'values'}, 'values'
+    mapping the allowed values to their display names (empty if any value is accepted).
+    """
+
+    def __init__(self, fields: list):
+        """
+        :param fields: (list) Fields built by `compile`, or the 'data' of a `datasetFilters` response
+        """
+        self.fields = [field if 'filterId' in field else self.compile_field(field) for field in fields]
+        self._index = {}
+        for field in self.fields:
+            for key in (field['filterId'], field['fieldLabel'], field['sqlName'], field.get('legacyFieldId')):
+                if key is not None:
+                    self._index.setdefault(str(key).lower(), field)
+
+    @staticmethod
+    def compile_field(dataset_filter: dict) -> dict:
+        """
+        :param dataset_filter: (dict) One item of the 'data' of a `datasetFilters` response
+        :return: (dict) Field of the index
+        """
+        match = _SQL_NAME.match(dataset_filter.get('searchSql') or '')
+        field_config = dataset_filter.get('fieldConfig') or {}
+        return {'filterId': dataset_filter.get('id'),
+                'fieldLabel': dataset_filter.get('fieldLabel'),
+                'sqlName': match.group(1) if match else None,
+                'legacyFieldId': dataset_filter.get('legacyFieldId'),
+                'type': field_config.get('type'),
+                'values': {str(item.get('value')): item.get('name')
+                           for item in dataset_filter.get('valueList') or [] if isinstance(item, dict)},
+                }
+
+    def __contains__(self, name: str) -> bool:
+        return str(name).lower() in self._index
+
+    def field(self, name: str) -> dict:
+        """
+        :param name: (str) Field label, SQL name, legacy field id or filter id
+        :return: (dict) Field of the index
+        """
+        try:
+            return self._index[str(name).lower()]
+        except KeyError:
+            raise KeyError(f'Unknown metadata field: {name}. Known fields: '
+                           f'{", ".join(sorted(field["fieldLabel"] or "" for field in self.fields))}') from None
+
+    def filter_id(self, name: str) -> str:
+        return self.field(name)['filterId']
+
+    def value(self, name: str, value, operand: str = '=') -> dict:
+        """
+        :param name: (str) Field label, SQL name, legacy field id or filter id
+        :param value: Value to search, or its display name for fields with a list of values
+        :param operand: (str) '=' or 'like'
+        :return: (dict) `MetadataValue` filter
+        :raise: ValueError if the field has a list of values and `value` is not one of them
+        """
+        field = self.field(name)
+        value = str(value)
+        if field['values'] and value not in field['values']:
+            names = {str(display_name).lower(): allowed for allowed, display_name in field['values'].items()}
+            if value.lower() not in names:
+                raise ValueError(f'Invalid value {value!r} for {field["fieldLabel"]}. Allowed values: '
+                                 f'{", ".join(field["values"])}')
+            value = names[value.lower()]
+        return MetadataValue(filterType='value', filterId=field['filterId'], value=value, operand=operand).dict
+
+    def between(self, name: str, first_value, second_value) -> dict:
+        """
+        :return: (dict) `MetadataBetween` filter
+        """
+        return MetadataBetween(filterType='between', filterId=self.filter_id(name), firstValue=first_value,
+                               secondValue=second_value).dict
+
+    @staticmethod
+    def all(*filters: dict) -> dict:
+        """
+        :return: (dict) `MetadataAnd` filter, or the filter itself if there is only one
+        """
+        return filters[0] if len(filters) == 1 else MetadataAnd(childFilters=list(filters)).dict
+
+    @staticmethod
+    def any(*filters: dict) -> dict:
+        """
+        :return: (dict) `MetadataOr` filter, or the filter itself if there is only one
+        """
+        return filters[0] if len(filters) == 1 else MetadataOr(childFilters=list(filters)).dict
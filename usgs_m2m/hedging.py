@@ -0,0 +1,182 @@
+"""
+Implementation date: 17.10.2026
+
+Hedged requests: if a call to a read-only endpoint has not answered after the usual latency of that endpoint (a
+percentile of the latencies observed so far), an identical second call is started and whichever succeeds first wins.
+This cuts the latency tail at the cost of a few extra requests.
+"""
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from .clientErrors import DeadlineExceeded
+
+
+class HedgePolicy:
+    """
+    Used by `API` and `AsyncAPI` for the endpoints in `endpoints`. The hedging delay of an endpoint is the
+    `percentile`-th percentile of its last `window` latencies, or `default_delay` until `min_samples` are known.
+    `hedges` counts the second calls sent per endpoint, `skipped` those not sent because all the hedging threads were
+    busy.
+    """
+    hedged_endpoints = {'scene-metadata', 'scene-metadata-xml', 'dataset', 'dataset-filters', 'grid2ll'}
+
+    def __init__(self, percentile: float = 95, min_samples: int = 20, default_delay: float = 1.0,
+                 window: int = 200, max_workers: int = 16, endpoints: set | None = None):
+        """
+        :param percentile: (float) Latency percentile (0-100) after which a second call is started
+        :param min_samples: (int) Number of latencies to observe before the percentile is used
+        :param default_delay: (float) Hedging delay in seconds until `min_samples` latencies are known
+        :param window: (int) Number of most recent latencies kept per endpoint
+        :param max_workers: (int) Threads running the second calls of `API`, not used by `AsyncAPI`
+        :param endpoints: (set) Endpoints to hedge, defaults to `hedged_endpoints`. Only read-only endpoints are hedged
+        """
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.default_delay = default_delay
+        self.window = window
+        self.max_workers = max_workers
+        self.endpoints = set(self.hedged_endpoints if endpoints is None else endpoints)
+        self.latencies = {}  # endpoint -> deque of latencies in seconds
+        self.hedges = {}  # endpoint -> number of second calls sent
+        self.skipped = {}  # endpoint -> number of second calls not sent
+        self._executor = None
+        self._busy = 0  # second calls running or queued on the executor
+        self._lock = threading.Lock()
+
+    def delay(self, endpoint: str) -> float:
+        """
+        :return: (float) Seconds to wait for the first call of `endpoint` before starting the second one
+        """
+        with self._lock:
+            latencies = sorted(self.latencies.get(endpoint, ()))
+        if len(latencies) < self.min_samples:
+            return self.default_delay
+        index = min(len(latencies) - 1, int(len(latencies) * self.percentile / 100))
+        return latencies[index]
+
+    def record(self, endpoint: str, latency: float):
+        with self._lock:
+            if endpoint not in self.latencies:
+                self.latencies[endpoint] = deque(maxlen=self.window)
+            self.latencies[endpoint].append(latency)
+
+    def _submit_hedge(self, endpoint: str, function) -> Future | None:
+        """
+        :return: (Future) Second call, None if all the hedging threads are busy
+        """
+        executor = self._get_executor()
+        with self._lock:
+            if self._busy >= self.max_workers:
+                self.skipped[endpoint] = self.skipped.get(endpoint, 0) + 1
+                return None
+            self._busy += 1
+            self.hedges[endpoint] = self.hedges.get(endpoint, 0) + 1
+        future = executor.submit(function)
+        future.add_done_callback(self._release)
+        return future
+
+    def _release(self, _future: Future):
+        with self._lock:
+            self._busy -= 1
+
+    def _count_hedge(self, endpoint: str):
+        with self._lock:
+            self.hedges[endpoint] = self.hedges.get(endpoint, 0) + 1
+
+    @staticmethod
+    def _start(function) -> Future:
+        """
+        Calls `function()` in a new thread, so that the first call never waits for a worker.
+        """
+        future = Future()
+
+        def target():
+            future.set_running_or_notify_cancel()
+            try:
+                future.set_result(function())
+            except BaseException as error:
+                future.set_exception(error)
+
+        threading.Thread(target=target, name='hedging-first-call', daemon=True).start()
+        return future
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='hedging')
+            return self._executor
+
+    def close(self):
+        """
+        Stops the worker threads once the calls in flight are finished.
+        """
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+    @staticmethod
+    def _wait_time(delay: float, expiry: float | None) -> float:
+        return delay if expiry is None else max(0.0, min(delay, expiry - time.monotonic()))
+
+    def run(self, endpoint: str, function, timeout: float | None = None):
+        """
+        Calls `function()` in a new thread, and a second time on the hedging threads if the first call is slower than
+        the hedging delay. The second call is skipped if all `max_workers` hedging threads are busy.
+        :param endpoint: (str) Endpoint path, e.g. 'scene-metadata'
+        :param function: Function without arguments making the call
+        :param timeout: (float) Maximum number of seconds to wait for a result
+        :return: Result of the first successful call
+        :raise: Error of the last failed call if both calls failed
+        """
+        started = time.monotonic()
+        expiry = None if timeout is None else started + timeout
+        pending = {self._start(function)}
+        done, _ = wait(pending, timeout=self._wait_time(self.delay(endpoint), expiry))
+        if not done and (expiry is None or time.monotonic() < expiry):
+            hedge = self._submit_hedge(endpoint, function)
+            if hedge is not None:
+                pending.add(hedge)
+        error = None
+        while pending:
+            remaining = None if expiry is None else max(0.0, expiry - time.monotonic())
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            if not done:
+                raise DeadlineExceeded(f'Deadline exceeded while waiting for a hedged call of {endpoint}')
+            for future in done:
+                if future.exception() is None:
+                    self.record(endpoint, time.monotonic() - started)
+                    return future.result()
+                error = future.exception()
+        raise error
+
+    async def run_async(self, endpoint: str, coroutine_function, timeout: float | None = None):
+        """
+        Asyncio counterpart of `run`: the losing call is cancelled.
+        """
+        started = time.monotonic()
+        expiry = None if timeout is None else started + timeout
+        pending = {asyncio.ensure_future(coroutine_function())}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=self._wait_time(self.delay(endpoint), expiry))
+            if not done and (expiry is None or time.monotonic() < expiry):
+                self._count_hedge(endpoint)
+                pending.add(asyncio.ensure_future(coroutine_function()))
+            error = None
+            while pending:
+                remaining = None if expiry is None else max(0.0, expiry - time.monotonic())
+                done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    raise DeadlineExceeded(f'Deadline exceeded while waiting for a hedged call of {endpoint}')
+                for task in done:
+                    if task.exception() is None:
+                        self.record(endpoint, time.monotonic() - started)
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
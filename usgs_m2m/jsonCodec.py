@@ -0,0 +1,82 @@
+"""
+Implementation date: 17.10.2026
+
+JSON codecs used by `API` to encode request payloads and decode responses. Select one with
+`API(json_codec='orjson')` or by assigning a codec instance to `api.json_codec`.
+"""
+import hashlib
+import json
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+
+class JsonCodec:
+    """
+    Codec based on the standard library `json` module. Always available.
+    """
+    name = 'json'
+
+    def dumps(self, obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    def loads(self, data: bytes | str):
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """
+    Codec based on `orjson` (pip install orjson), several times faster than `json` on large responses.
+    """
+    name = 'orjson'
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError('OrjsonCodec requires the `orjson` package: pip install orjson')
+
+    def dumps(self, obj) -> bytes:
+        return orjson.dumps(obj)
+
+    def loads(self, data: bytes | str):
+        return orjson.loads(data)
+
+
+json_codecs = {codec.name: codec for codec in (JsonCodec, OrjsonCodec)}
+
+
+def strip_none(obj):
+    """
+    Recursively drops dictionary keys whose value is None. None items of lists are kept, their position matters.
+    :param obj: JSON-serializable object
+    :return: Copy of the object without None values in dictionaries
+    """
+    if isinstance(obj, dict):
+        return {key: strip_none(value) for key, value in obj.items() if value is not None}
+    if isinstance(obj, (list, tuple)):
+        return [strip_none(item) for item in obj]
+    return obj
+
+
+def payload_hash(json_payload: dict | None) -> str:
+    """
+    :param json_payload: (dict) Request payload
+    :return: (str) Hash of the payload that does not depend on key order or on None values
+    """
+    canonical = json.dumps(strip_none(json_payload), sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def get_json_codec(codec: str | JsonCodec = 'json') -> JsonCodec:
+    """
+    :param codec: (str | JsonCodec) Codec instance, codec name ('json', 'orjson') or 'auto' for the fastest installed
+    :return: (JsonCodec) Codec instance
+    """
+    if isinstance(codec, JsonCodec):
+        return codec
+    if codec == 'auto':
+        codec = 'orjson' if orjson is not None else 'json'
+    if codec not in json_codecs:
+        raise ValueError(f'Unknown JSON codec: {codec}. Use one of: auto, {", ".join(json_codecs)}')
+    return json_codecs[codec]()
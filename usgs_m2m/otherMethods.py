@@ -1,9 +1,9 @@
 import os
-import requests
 import logging
 from datetime import datetime
 from tqdm import tqdm
 
+from .transports import RequestsTransport
 from .usgsDataTypes import DownloadInput
 
 
@@ -18,6 +18,19 @@ class otherMethods:
 
     @classmethod
     def download(cls, api, datasetName, entityId, productName, output_dir):
+        """
+        :param api: (usgsMethods) Instance of usgsMethods()
+        :param datasetName: (str) Dataset alias
+        :param entityId: (str) entityId
+        :param productName: (str) Product to download
+        :param output_dir: (str) Directory to save files to
+        :return: (list) Results of `_download` for each available download URL, empty if the product is not available
+        """
+        response_cache = getattr(api, 'response_cache', None)
+        if response_cache is not None and response_cache.is_unavailable(datasetName, entityId, productName):
+            logging.warning(f"{datetime.now()} productName={productName} of entityId={entityId} was recently reported "
+                            f"as not available, skipped")
+            return []
         downloadOptions = api.downloadOptions(datasetName=datasetName, entityIds=entityId)
         datasetId, productId = None, None
         for downloadOption in downloadOptions['data']:
@@ -27,6 +40,7 @@ class otherMethods:
                 break
         if (datasetId, productId) == (None, None):
             logging.error(f"{datetime.now()} Can't find productName={productName} in datasetName={datasetName}")
+            return []
 
         # download = DownloadResponse(entityId=entityId, datasetId=datasetId, productId=productId,
         #                                           productName=productName).dict
@@ -43,20 +57,25 @@ class otherMethods:
         results_list = []
         for availableDownload in availableDownloads:
             url = availableDownload['url']
-            path = cls._download(url, output_dir)
+            path = cls._download(url, output_dir, timeout=api.timeout, transport=api.session)
             results_list.append(path)
         return results_list
 
     @classmethod
-    def _download(cls, url, output_dir, chunk_size=1024):
+    def _download(cls, url, output_dir, chunk_size=1024, timeout=(10, 120), transport=None):
         """
         :param url:
         :param output_dir:
         :param chunk_size:
+        :param timeout: (float | tuple) (connect, read) timeouts in seconds, the read timeout applies to every chunk
+        :param transport: (Transport) Transport sending the request, a new `RequestsTransport` if None
         :return: file_path: (str) - if successful, None - if interrupted, 'Skip' - if landsat file is offline,
         """
+        if transport is None:
+            with RequestsTransport(pool_size=1) as transport:
+                return cls._download(url, output_dir, chunk_size, timeout, transport)
 
-        with requests.get(url, stream=True, allow_redirects=True) as r:
+        with transport.get(url, stream=True, allow_redirects=True, timeout=timeout) as r:
             try:
                 expected_file_size = int(r.headers['Content-Length'])
             except KeyError:  # if `Content-Length` header is absent - it means file is not downloadable now
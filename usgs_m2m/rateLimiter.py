@@ -0,0 +1,174 @@
+"""
+Implementation date: 17.10.2026
+
+Client-side admission control: keeps `API` just under the USGS rate limits instead of running into RATE_LIMIT and
+RATE_LIMIT_USER_DL errors. Download limits are calibrated from the `rateLimitSummary` method, see:
+https://m2m.cr.usgs.gov/api/docs/reference/#rate-limit-summary
+"""
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket. `reserve` takes the tokens at once, even if the balance goes below zero, and returns how
+    long the caller has to wait before using them. Callers are therefore served in arrival order and nobody polls.
+    """
+
+    def __init__(self, rate: float, capacity: float, tokens: float | None = None):
+        """
+        :param rate: (float) Tokens added per second, must be positive
+        :param capacity: (float) Maximum number of tokens, i.e. the allowed burst
+        :param tokens: (float) Initial number of tokens, defaults to `capacity`
+        """
+        if rate <= 0:
+            raise ValueError(f'Token bucket rate must be positive, got {rate}')
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity if tokens is None else min(tokens, capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, tokens: float = 1) -> float:
+        """
+        :param tokens: (float) Number of tokens to take
+        :return: (float) Seconds to wait before the tokens may be used
+        """
+        with self._lock:
+            self._refill()
+            self.tokens -= tokens
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def configure(self, rate: float | None = None, capacity: float | None = None, tokens: float | None = None):
+        """
+        Changes the bucket parameters, keeping the current balance unless `tokens` is given.
+        """
+        with self._lock:
+            self._refill()
+            if rate is not None:
+                if rate <= 0:
+                    raise ValueError(f'Token bucket rate must be positive, got {rate}')
+                self.rate = rate
+            if capacity is not None:
+                self.capacity = capacity
+            if tokens is not None:
+                self.tokens = tokens
+            self.tokens = min(self.tokens, self.capacity)
+
+
+class RateLimiter:
+    """
+    Throttles the requests of an `API` instance with two token buckets:
+        requests - every request, only if `requests_per_second` is set
+        downloads - products requested with `downloadRequest`, calibrated from `rateLimitSummary`: the bucket refills
+                    at `safety_margin` times the 15-minute limit and starts from the remaining limits of the user/IP.
+    The calibration is refreshed every `calibration_interval` seconds and whenever a `downloadRequest` response reports
+    the remaining limits.
+    """
+    download_window = 15 * 60  # seconds, the USGS download limits are counted over the past 15 minutes
+    download_endpoints = {'download-request'}
+    limit_fields = ('recentDownloadCount', 'pendingDownloadCount', 'unattemptedDownloadCount')
+
+    def __init__(self, requests_per_second: float | None = None, burst: int | None = None,
+                 safety_margin: float = 0.9, calibration_interval: float = 300):
+        """
+        :param requests_per_second: (float) Sustained rate of requests, None for no limit
+        :param burst: (int) Number of requests that may be sent at once, defaults to `requests_per_second`
+        :param safety_margin: (float) Fraction of the USGS download limits the client allows itself to use
+        :param calibration_interval: (float) Seconds between two calls to `rateLimitSummary`
+        """
+        self.requests = None
+        if requests_per_second is not None:
+            self.requests = TokenBucket(requests_per_second, burst or max(1.0, requests_per_second))
+        self.downloads = None  # created by the first calibration
+        self.safety_margin = safety_margin
+        self.calibration_interval = calibration_interval
+        self._initial_downloads = 0
+        self._next_calibration = 0.0
+        self._lock = threading.Lock()
+
+    def calibration_due(self) -> bool:
+        """
+        :return: (bool) True if `rateLimitSummary` should be called now. Only one caller per interval gets True
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now < self._next_calibration:
+                return False
+            self._next_calibration = now + self.calibration_interval
+            return True
+
+    def reserve(self, endpoint: str, json_payload: dict | None) -> float:
+        """
+        Takes the tokens needed by a request.
+        :param endpoint: (str) Endpoint path, e.g. 'download-request'
+        :param json_payload: (dict) Request payload
+        :return: (float) Seconds to wait before sending the request
+        """
+        delay = 0.0
+        if self.requests is not None:
+            delay = self.requests.reserve()
+        if self.downloads is not None and endpoint in self.download_endpoints:
+            delay = max(delay, self.downloads.reserve(self.download_count(json_payload)))
+        return delay
+
+    @staticmethod
+    def download_count(json_payload: dict | None) -> int:
+        json_payload = json_payload or {}
+        return max(1, len(json_payload.get('downloads') or []) + len(json_payload.get('dataPaths') or []))
+
+    def observe(self, endpoint: str, content: dict):
+        """
+        Updates the download bucket from responses that report the rate limits.
+        :param endpoint: (str) Endpoint path
+        :param content: (dict) Response as a dictionary
+        """
+        data = content.get('data')
+        if not isinstance(data, dict):
+            return
+        if endpoint == 'rate-limit-summary':
+            self.calibrate(data)
+        elif endpoint in self.download_endpoints and data.get('remainingLimits') and self.downloads is not None:
+            remaining = self._min_limit(data['remainingLimits'], self.limit_fields)
+            if remaining is not None:
+                self.downloads.configure(tokens=remaining - self._reserve_tokens())
+
+    def calibrate(self, summary: dict):
+        """
+        :param summary: (dict) 'data' element of the `rateLimitSummary` response
+        """
+        initial = self._min_limit(summary.get('initialLimits'), ('recentDownloadCount',))
+        if not initial:
+            return
+        remaining = self._min_limit(summary.get('remainingLimits'), self.limit_fields)
+        capacity = initial * self.safety_margin
+        rate = capacity / self.download_window
+        with self._lock:
+            self._initial_downloads = initial
+            tokens = None if remaining is None else remaining - self._reserve_tokens()
+            if self.downloads is None:
+                self.downloads = TokenBucket(rate, capacity, tokens)
+            else:
+                self.downloads.configure(rate, capacity, tokens)
+
+    def _reserve_tokens(self) -> float:
+        """
+        :return: (float) Part of the download limit that is left unused as a safety margin
+        """
+        return self._initial_downloads * (1 - self.safety_margin)
+
+    @staticmethod
+    def _min_limit(limits: list | dict | None, fields: tuple) -> int | None:
+        """
+        :return: (int) Smallest value of the given fields over all limit entries (user and IP), None if there is none
+        """
+        if isinstance(limits, dict):
+            limits = [limits]
+        values = [limit[field] for limit in limits or [] for field in fields
+                  if isinstance(limit, dict) and isinstance(limit.get(field), (int, float))]
+        return min(values) if values else None
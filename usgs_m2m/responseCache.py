@@ -0,0 +1,206 @@
+"""
+Implementation date: 17.10.2026
+
+In-memory cache of the responses of endpoints whose data rarely changes (datasets, filters, grids, ...):
+
+    api = API(response_cache=ResponseCache(max_entries=2048))
+    api.dataset(datasetName='landsat_ot_c2_l1')  # request
+    api.dataset(datasetName='landsat_ot_c2_l1')  # served from the cache
+
+NOT_FOUND errors of `negative_ttls` endpoints and the products that `downloadOptions` reports as unavailable are also
+remembered for a short time, so that known-missing scenes and offline products are not asked about again.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+from .usgsErrors import NOT_FOUND
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache with a time to live per endpoint. Only the endpoints of `ttls` are cached, and only
+    successful responses. Cached responses are shared between callers, do not modify them.
+
+    `hits` and `misses` count the lookups per endpoint, `negative_hits` the requests skipped thanks to a remembered
+    error or unavailable product, see also `stats()`.
+    """
+    default_ttls = {'dataset': 60 * 60,  # seconds
+                    'dataset-bulk-products': 24 * 60 * 60,
+                    'dataset-catalogs': 24 * 60 * 60,
+                    'dataset-download-options': 24 * 60 * 60,
+                    'dataset-file-groups': 24 * 60 * 60,
+                    'dataset-filters': 24 * 60 * 60,
+                    'download-labels': 5 * 60,
+                    'grid2ll': 30 * 24 * 60 * 60,
+                    }
+    default_negative_ttls = {'dataset': 5 * 60,  # seconds
+                             'scene-metadata': 15 * 60,
+                             'scene-metadata-xml': 15 * 60,
+                             }
+    negative_errors = (NOT_FOUND,)
+
+    def __init__(self, max_entries: int = 1024, ttls: dict | None = None, negative_ttls: dict | None = None,
+                 unavailable_ttl: float = 15 * 60):
+        """
+        :param max_entries: (int) Maximum number of responses kept, the least recently used are evicted first
+        :param ttls: (dict) Endpoint -> time to live in seconds, defaults to `default_ttls`
+        :param negative_ttls: (dict) Endpoint -> seconds a NOT_FOUND error is raised again without a request, defaults
+                                     to `default_negative_ttls`
+        :param unavailable_ttl: (float) Seconds a product reported as not available by `downloadOptions` is skipped,
+                                        0 disables it
+        """
+        self.max_entries = max_entries
+        self.ttls = dict(self.default_ttls if ttls is None else ttls)
+        self.negative_ttls = dict(self.default_negative_ttls if negative_ttls is None else negative_ttls)
+        self.unavailable_ttl = unavailable_ttl
+        self.entries = OrderedDict()  # (endpoint, request hash) -> (expiry, response)
+        self.errors = OrderedDict()  # (endpoint, request hash) -> (expiry, error)
+        self.unavailable = OrderedDict()  # (dataset, entityId, productName) -> expiry
+        self.hits = {}
+        self.misses = {}
+        self.negative_hits = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, endpoint: str, request_hash: str) -> dict | None:
+        """
+        :param endpoint: (str) Endpoint path, e.g. 'dataset'
+        :param request_hash: (str) Hash of the request (payload, apiURL and user), see `API._request_hash`
+        :return: (dict) Cached response, None if there is none or it has expired
+        """
+        if endpoint not in self.ttls:
+            return None
+        key = (endpoint, request_hash)
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                del self.entries[key]
+                entry = None
+            if entry is None:
+                self.misses[endpoint] = self.misses.get(endpoint, 0) + 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits[endpoint] = self.hits.get(endpoint, 0) + 1
+            return entry[1]
+
+    def set(self, endpoint: str, request_hash: str, response: dict, ttl: float | None = None):
+        """
+        :param ttl: (float) Time to live in seconds, defaults to the TTL of the endpoint
+        """
+        ttl = self.ttls.get(endpoint) if ttl is None else ttl
+        if ttl is None or ttl <= 0:
+            return
+        key = (endpoint, request_hash)
+        with self._lock:
+            self.entries[key] = (time.monotonic() + ttl, response)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def get_error(self, endpoint: str, request_hash: str) -> Exception | None:
+        """
+        :return: (Exception) Error of a request known to fail, None if there is none or it has expired
+        """
+        if endpoint not in self.negative_ttls:
+            return None
+        key = (endpoint, request_hash)
+        with self._lock:
+            entry = self.errors.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self.errors[key]
+                return None
+            self.negative_hits[endpoint] = self.negative_hits.get(endpoint, 0) + 1
+            return entry[1]
+
+    def set_error(self, endpoint: str, request_hash: str, error: Exception):
+        """
+        Remembers the error of a request if it is one of `negative_errors` and the endpoint is in `negative_ttls`.
+        """
+        ttl = self.negative_ttls.get(endpoint)
+        if ttl is None or ttl <= 0 or not isinstance(error, self.negative_errors):
+            return
+        key = (endpoint, request_hash)
+        with self._lock:
+            self.errors[key] = (time.monotonic() + ttl, error)
+            self.errors.move_to_end(key)
+            while len(self.errors) > self.max_entries:
+                self.errors.popitem(last=False)
+
+    @staticmethod
+    def _product_key(datasetName: str, entityId, productName: str) -> tuple:
+        return str(datasetName).lower(), str(entityId), productName
+
+    def is_unavailable(self, datasetName: str, entityId: str, productName: str) -> bool:
+        """
+        :return: (bool) True if `downloadOptions` recently reported the product of the scene as not available
+        """
+        key = self._product_key(datasetName, entityId, productName)
+        with self._lock:
+            expiry = self.unavailable.get(key)
+            if expiry is None:
+                return False
+            if expiry <= time.monotonic():
+                del self.unavailable[key]
+                return False
+            self.negative_hits['download-options'] = self.negative_hits.get('download-options', 0) + 1
+            return True
+
+    def record_download_options(self, json_payload: dict | None, response: dict):
+        """
+        Remembers the products that a `downloadOptions` response reports as not available, and forgets those that
+        became available.
+        """
+        data = response.get('data')
+        if self.unavailable_ttl <= 0 or not json_payload or not isinstance(data, list):
+            return
+        expiry = time.monotonic() + self.unavailable_ttl
+        with self._lock:
+            for option in data:
+                if not isinstance(option, dict) or option.get('entityId') is None or not option.get('productName'):
+                    continue
+                key = self._product_key(json_payload.get('datasetName'), option['entityId'], option['productName'])
+                if option.get('available') is False:
+                    self.unavailable[key] = expiry
+                    self.unavailable.move_to_end(key)
+                else:
+                    self.unavailable.pop(key, None)
+            while len(self.unavailable) > self.max_entries:
+                self.unavailable.popitem(last=False)
+
+    def invalidate(self, endpoint: str | None = None, request_hash: str | None = None):
+        """
+        Drops the cached responses and errors of an endpoint (one request if `request_hash` is given), or of all
+        endpoints if `endpoint` is None. Invalidating 'download-options' forgets the unavailable products.
+        """
+        with self._lock:
+            if endpoint is None:
+                self.entries.clear()
+                self.errors.clear()
+                self.unavailable.clear()
+            elif request_hash is not None:
+                self.entries.pop((endpoint, request_hash), None)
+                self.errors.pop((endpoint, request_hash), None)
+            else:
+                for cache in (self.entries, self.errors):
+                    for key in [key for key in cache if key[0] == endpoint]:
+                        del cache[key]
+                if endpoint == 'download-options':
+                    self.unavailable.clear()
+
+    def stats(self) -> dict:
+        """
+        :return: (dict) Endpoint -> {'hits': ..., 'misses': ..., 'entries': ..., 'negative_hits': ...}
+        """
+        with self._lock:
+            entries = {}
+            for endpoint, _ in self.entries:
+                entries[endpoint] = entries.get(endpoint, 0) + 1
+            return {endpoint: {'hits': self.hits.get(endpoint, 0), 'misses': self.misses.get(endpoint, 0),
+                               'entries': entries.get(endpoint, 0),
+                               'negative_hits': self.negative_hits.get(endpoint, 0)}
+                    for endpoint in sorted(set(self.hits) | set(self.misses) | set(entries) | set(self.negative_hits))}
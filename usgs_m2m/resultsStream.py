@@ -0,0 +1,180 @@
+"""
+Implementation date: 17.10.2026
+
+Incremental parsing of responses with a large `data.results` array, such as `sceneSearch` with
+`maxResults=50000` and `metadataType='full'`. The body is read in chunks, and each result is decoded only when the
+iteration reaches it. Peak memory is therefore one chunk plus one result, whatever the page size.
+"""
+import codecs
+import json
+
+from .checkResponse import _check_usgs_error
+
+_RESULTS = object()  # yielded by `ResultsStream._parse` when the results array starts
+
+
+class ResultsStream:
+    """
+    Iterator over the `data.results` items of a streamed response:
+
+        with api.sceneSearchStream('landsat_ot_c2_l1', maxResults=50000, metadataType='full') as results:
+            for scene in results:
+                ...
+            print(results.totalHits, results.nextRecord)
+
+    `header` holds the top-level fields ('requestId', 'errorCode', ...), and `data` holds the fields of 'data' other
+    than 'results'. The fields of `data` are also readable as attributes, e.g. `results.totalHits`. Fields that the
+    server sends after the results are only known once the iteration is over. The results can be iterated only once.
+    USGS errors are raised as soon as 'errorCode' and 'errorMessage' are read, like `_check_response` does.
+    """
+    chunk_size = 64 * 1024
+
+    def __init__(self, response, chunk_size: int | None = None):
+        """
+        :param response: HTTP response opened with `stream=True`
+        :param chunk_size: (int) Number of bytes read from the network at once
+        """
+        self.response = response
+        self.chunk_size = chunk_size or self.chunk_size
+        self.header = {}
+        self.data = {}
+        self._chunks = response.iter_content(self.chunk_size)
+        self._text = codecs.getincrementaldecoder('utf-8')()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+        self._items = self._parse()
+        try:
+            if next(self._items, None) is not _RESULTS:  # the whole response was read, there are no results
+                self._finish()
+        except Exception:
+            self.close()
+            raise
+
+    def __getattr__(self, name: str):
+        data = self.__dict__.get('data', {})
+        if name in data:
+            return data[name]
+        raise AttributeError(f'{type(self).__name__} has no attribute {name!r}')
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> dict:
+        try:
+            return next(self._items)
+        except StopIteration:
+            self._finish()
+            raise
+        except Exception:
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Releases the connection. Called automatically once all results are read.
+        """
+        self.response.close()
+
+    def _finish(self):
+        self.close()
+        self._check_error()
+
+    def _check_error(self):
+        if 'errorCode' in self.header:
+            _check_usgs_error({'errorMessage': None, **self.header})
+
+    def _read(self):
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self._buffer += self._text.decode(b'', final=True)
+            self._eof = True
+            return
+        if self._pos >= self.chunk_size:  # drop the part already parsed
+            self._buffer = self._buffer[self._pos:]
+            self._pos = 0
+        self._buffer += self._text.decode(chunk)
+
+    def _peek(self) -> str:
+        """
+        :return: (str) Next non-whitespace character, '' at the end of the body
+        """
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in ' \t\r\n':
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if self._eof:
+                return ''
+            self._read()
+
+    def _expect(self, characters: str) -> str:
+        character = self._peek()
+        if not character or character not in characters:
+            raise json.JSONDecodeError(f'Expecting one of {characters!r}', self._buffer, self._pos)
+        self._pos += 1
+        return character
+
+    def _value(self):
+        """
+        :return: Next complete JSON value. A value ending exactly at the end of the buffer (e.g. a number) may be
+                 truncated, so it is only accepted once more data or the end of the body is there.
+        """
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+                if end < len(self._buffer) or self._eof:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            self._read()
+
+    def _members(self):
+        """
+        Yields the keys of the object starting at the current position, leaving the position on the value.
+        """
+        self._expect('{')
+        if self._peek() == '}':
+            self._pos += 1
+            return
+        while True:
+            key = self._value()
+            self._expect(':')
+            yield key
+            if self._expect(',}') == '}':
+                return
+
+    def _parse(self):
+        for key in self._members():
+            if key == 'data' and self._peek() == '{':
+                yield from self._parse_data()
+            else:
+                self.header[key] = self._value()
+                if 'errorCode' in self.header and 'errorMessage' in self.header:
+                    self._check_error()
+
+    def _parse_data(self):
+        self.header['data'] = self.data
+        for key in self._members():
+            if key == 'results' and self._peek() == '[':
+                yield _RESULTS
+                self._pos += 1
+                if self._peek() == ']':
+                    self._pos += 1
+                    continue
+                while True:
+                    yield self._value()
+                    if self._expect(',]') == ']':
+                        break
+            else:
+                self.data[key] = self._value()
@@ -0,0 +1,83 @@
+"""
+Implementation date: 17.10.2026
+
+Retry policy used by `API` to repeat requests that failed for a transient reason.
+"""
+import random
+import time
+
+import requests
+
+from .usgsErrors import RATE_LIMIT, SERVER_ERROR, ENDPOINT_UNAVAILABLE, SEARCH_UNAVAILABLE
+
+try:
+    import httpx
+except ImportError:  # optional dependency
+    httpx = None
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter: the delay before retry N (N >= 1) is a random value between 0 and
+    min(backoff_max, backoff_base * 2 ** (N - 1)) seconds. A `Retry-After` header sent by the server is honored.
+
+    Retryable failures are HTTP 429/5xx responses, connection errors (also resets while the body is read), timeouts,
+    and the USGS errors RATE_LIMIT, SERVER_ERROR, ENDPOINT_UNAVAILABLE and SEARCH_UNAVAILABLE. Endpoints in
+    `non_idempotent_endpoints` are never retried unless `retry_non_idempotent` is True, because a lost response does
+    not mean the request was not executed.
+    """
+    retryable_statuses = {429, 500, 502, 503, 504}
+    retryable_errors = (RATE_LIMIT, SERVER_ERROR, ENDPOINT_UNAVAILABLE, SEARCH_UNAVAILABLE,
+                        requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                        requests.exceptions.ChunkedEncodingError, requests.exceptions.ContentDecodingError)
+    if httpx is not None:
+        retryable_errors += (httpx.TransportError, httpx.DecodingError)
+    non_idempotent_endpoints = {'order-submit', 'download-request', 'download-order-load'}
+
+    def __init__(self, max_attempts: int = 5, backoff_base: float = 1.0, backoff_max: float = 60.0,
+                 retry_non_idempotent: bool = False):
+        """
+        :param max_attempts: (int) Maximum number of attempts per call, the first one included. 1 disables retries
+        :param backoff_base: (float) Upper bound in seconds of the delay before the first retry
+        :param backoff_max: (float) Cap in seconds of the delay between two attempts
+        :param retry_non_idempotent: (bool) Also retry endpoints such as 'order-submit' and 'download-request'
+        """
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_non_idempotent = retry_non_idempotent
+
+    def is_retryable(self, endpoint: str, error: Exception) -> bool:
+        if endpoint in self.non_idempotent_endpoints and not self.retry_non_idempotent:
+            return False
+        if isinstance(error, self.retryable_errors):
+            return True
+        response = getattr(error, 'response', None)  # requests.HTTPError, httpx.HTTPStatusError
+        return response is not None and response.status_code in self.retryable_statuses
+
+    def backoff(self, attempt: int, error: Exception) -> float:
+        """
+        :param attempt: (int) Number of attempts already made
+        :param error: (Exception) Error of the last attempt
+        :return: (float) Delay in seconds before the next attempt
+        """
+        response = getattr(error, 'response', None)
+        retry_after = response.headers.get('Retry-After') if response is not None else None
+        if retry_after is not None and retry_after.isdigit():
+            return min(float(retry_after), self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+
+    def next_delay(self, endpoint: str, error: Exception, attempt: int, expiry: float | None = None) -> float | None:
+        """
+        :param endpoint: (str) Endpoint path, e.g. 'scene-search'
+        :param error: (Exception) Error of the last attempt
+        :param attempt: (int) Number of attempts already made
+        :param expiry: (float) `time.monotonic()` value at which the call must be finished, None if it has no deadline
+        :return: (float) Delay in seconds before the next attempt, None if the error must be raised
+        """
+        if attempt >= self.max_attempts or not self.is_retryable(endpoint, error):
+            return None
+        delay = self.backoff(attempt, error)
+        if expiry is not None and time.monotonic() + delay >= expiry:
+            return None
+        return delay
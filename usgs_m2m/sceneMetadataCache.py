@@ -0,0 +1,186 @@
+"""
+Implementation date: 17.10.2026
+
+Cache of scene metadata keyed by (datasetName, entityId, metadataType), in front of `sceneMetadata` and
+`sceneMetadataXML`, with batch filling of the missing scenes:
+
+    cache = SceneMetadataCache(path='scene_metadata.sqlite')  # path is optional
+    api = API(scene_metadata_cache=cache)
+    metadata = cache.get_many(api, 'landsat_ot_c2_l1', entityIds, metadataType='full')  # one batch for the misses
+    api.sceneMetadata('landsat_ot_c2_l1', entityIds[0], metadataType='full')  # served from the cache
+"""
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from .jsonCodec import JsonCodec
+
+
+class SceneMetadataCache:
+    """
+    Thread-safe LRU cache of the 'data' of scene metadata responses, bounded to `max_entries` in memory and optionally
+    persisted in a SQLite database (`path`) shared by processes. Calls with `idType`, `includeNullMetadataValues` or
+    `useCustomization` are not cached, as their responses differ.
+    """
+    endpoints = {'scene-metadata': 'json', 'scene-metadata-xml': 'xml'}
+    uncached_parameters = ('idType', 'includeNullMetadataValues', 'useCustomization')
+
+    def __init__(self, max_entries: int = 10000, path: str | None = None, ttl: float | None = 30 * 24 * 60 * 60,
+                 batch_size: int = 1000):
+        """
+        :param max_entries: (int) Maximum number of scenes kept in memory, the least recently used are evicted first
+        :param path: (str) SQLite database persisting the cache, None (default) keeps it in memory only
+        :param ttl: (float) Seconds after which a persisted entry is ignored, None for no expiry
+        :param batch_size: (int) Maximum number of scenes requested at once by `get_many`
+        """
+        self.max_entries = max_entries
+        self.path = path
+        self.ttl = ttl
+        self.batch_size = batch_size
+        self.codec = JsonCodec()
+        self.entries = OrderedDict()  # (dataset, entityId, metadataType, 'json' or 'xml') -> metadata
+        self.hits = 0
+        self.misses = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        if path is not None:
+            with self._connection() as connection:
+                connection.execute('CREATE TABLE IF NOT EXISTS scene_metadata (dataset TEXT NOT NULL, entity_id TEXT '
+                                   'NOT NULL, metadata_type TEXT NOT NULL, format TEXT NOT NULL, stored REAL NOT '
+                                   'NULL, body BLOB NOT NULL, PRIMARY KEY (dataset, entity_id, metadata_type, format))')
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30)
+            connection.execute('PRAGMA journal_mode=WAL')
+            self._local.connection = connection
+        return connection
+
+    @staticmethod
+    def _key(datasetName: str, entityId: str, metadataType: str | None, kind: str = 'json') -> tuple:
+        return datasetName.lower(), str(entityId), metadataType or '', kind
+
+    def key_for_request(self, endpoint: str, json_payload: dict | None) -> tuple | None:
+        """
+        :return: (tuple) Cache key of a `sceneMetadata`/`sceneMetadataXML` request, None if it is not cacheable
+        """
+        if endpoint not in self.endpoints or not json_payload:
+            return None
+        if any(json_payload.get(parameter) is not None for parameter in self.uncached_parameters):
+            return None
+        if not isinstance(json_payload.get('datasetName'), str) or json_payload.get('entityId') is None:
+            return None
+        return self._key(json_payload['datasetName'], json_payload['entityId'], json_payload.get('metadataType'),
+                         self.endpoints[endpoint])
+
+    def get(self, key: tuple):
+        """
+        :param key: (tuple) Key built by `key_for_request`
+        :return: Cached metadata, None if the scene is not cached
+        """
+        with self._lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key]
+        metadata = self._load(key)
+        with self._lock:
+            if metadata is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._remember(key, metadata)
+        return metadata
+
+    def set(self, key: tuple, metadata):
+        self.set_many({key: metadata})
+
+    def set_many(self, items: dict):
+        """
+        :param items: (dict) Key -> metadata
+        """
+        with self._lock:
+            for key, metadata in items.items():
+                self._remember(key, metadata)
+        if self.path is not None and items:
+            now = time.time()
+            with self._connection() as connection:
+                connection.executemany('INSERT OR REPLACE INTO scene_metadata VALUES (?, ?, ?, ?, ?, ?)',
+                                       [(*key, now, self.codec.dumps(metadata)) for key, metadata in items.items()])
+
+    def _remember(self, key: tuple, metadata):
+        self.entries[key] = metadata
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def _load(self, key: tuple):
+        if self.path is None:
+            return None
+        oldest = 0 if self.ttl is None else time.time() - self.ttl
+        row = self._connection().execute('SELECT body FROM scene_metadata WHERE dataset = ? AND entity_id = ? AND '
+                                         'metadata_type = ? AND format = ? AND stored > ?', (*key, oldest)).fetchone()
+        return self.codec.loads(row[0]) if row else None
+
+    def invalidate(self, datasetName: str | None = None, entityId: str | None = None):
+        """
+        Drops the cached metadata of a scene, of a dataset if `entityId` is None, or everything if `datasetName` is
+        None.
+        """
+        def matches(key):
+            return (datasetName is None or key[0] == datasetName.lower()) and (entityId is None or key[1] == entityId)
+
+        with self._lock:
+            for key in [key for key in self.entries if matches(key)]:
+                del self.entries[key]
+        if self.path is not None:
+            with self._connection() as connection:
+                if datasetName is None:
+                    connection.execute('DELETE FROM scene_metadata')
+                elif entityId is None:
+                    connection.execute('DELETE FROM scene_metadata WHERE dataset = ?', (datasetName.lower(),))
+                else:
+                    connection.execute('DELETE FROM scene_metadata WHERE dataset = ? AND entity_id = ?',
+                                       (datasetName.lower(), entityId))
+
+    def get_many(self, api, datasetName: str, entityIds: list, metadataType: str | None = None) -> dict:
+        """
+        Returns the metadata of many scenes. The scenes that are not cached are requested in batches of `batch_size`
+        with a temporary scene list: `sceneListAdd`, `sceneMetadataList` and `sceneListRemove` (3 requests per batch
+        instead of one per scene).
+        :param api: (API) Logged-in `API` instance
+        :param datasetName: (str) Dataset alias
+        :param entityIds: (list) Scene identifiers
+        :param metadataType: (str) 'summary' or 'full'
+        :return: (dict) entityId -> metadata, scenes unknown to the API are missing
+        """
+        results = {}
+        missing = []
+        for entityId in dict.fromkeys(str(entityId) for entityId in entityIds):
+            metadata = self.get(self._key(datasetName, entityId, metadataType))
+            if metadata is None:
+                missing.append(entityId)
+            else:
+                results[entityId] = metadata
+        for start in range(0, len(missing), self.batch_size):
+            results.update(self._fill(api, datasetName, missing[start:start + self.batch_size], metadataType))
+        return results
+
+    def _fill(self, api, datasetName: str, entityIds: list, metadataType: str | None) -> dict:
+        listId = f'usgs_m2m_metadata_{uuid.uuid4().hex}'
+        api.sceneListAdd(listId, datasetName, entityIds=entityIds, timeToLive='PT1H')
+        try:
+            data = api.sceneMetadataList(listId, datasetName=datasetName, metadataType=metadataType)['data']
+        finally:
+            api.sceneListRemove(listId)
+        if isinstance(data, dict):  # grouped by dataset
+            data = [scene for scenes in data.values() if isinstance(scenes, list) for scene in scenes]
+        found = {str(scene['entityId']): scene for scene in data or [] if isinstance(scene, dict) and 'entityId' in scene}
+        self.set_many({self._key(datasetName, entityId, metadataType): scene for entityId, scene in found.items()})
+        return found
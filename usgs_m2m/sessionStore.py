@@ -0,0 +1,139 @@
+"""
+Implementation date: 17.10.2026
+
+On-disk store of API keys shared by the processes of a user, so that a fresh process can reuse a key obtained by
+another one instead of logging in:
+
+    api = API(session_store=SessionStore())
+    api.loginToken('usgs_username', 'usgs_token')  # no request if a valid key is stored
+
+Keys are stored under a hash of the API URL and the login payload, so a key is only reused with the credentials that
+obtained it; the password or token itself is never stored. The file is only readable by its owner, and concurrent
+writers are serialized with a lock file.
+"""
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:  # POSIX
+    msvcrt = None
+
+
+class SessionStore:
+    """
+    JSON file mapping a login identity to {'apiKey': ..., 'expires': ...}. A USGS API key is valid for two hours after
+    its last use, so `touch` pushes the expiry back at most once every `touch_interval` seconds. Keys are validated
+    lazily: a stored key that the server rejects is renewed by `API` (see `API.renew_api_key`).
+    """
+    key_lifetime = 2 * 60 * 60  # seconds an API key stays valid after its last use
+    default_path = os.path.join(os.path.expanduser('~'), '.usgs_m2m', 'sessions.json')
+
+    def __init__(self, path: str | None = None, safety_margin: float = 300, touch_interval: float = 60):
+        """
+        :param path: (str) Path of the store, defaults to `~/.usgs_m2m/sessions.json`
+        :param safety_margin: (float) Keys expiring within this many seconds are not loaded
+        :param touch_interval: (float) Minimum number of seconds between two expiry updates of a key
+        """
+        self.path = path or self.default_path
+        self.safety_margin = safety_margin
+        self.touch_interval = touch_interval
+        self._touched = {}  # identity -> time.time() of the last expiry update
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _locked(self):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        with self._lock:
+            fd = os.open(self.path + '.lock', os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+                elif msvcrt is not None:
+                    msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+                elif msvcrt is not None:
+                    os.lseek(fd, 0, os.SEEK_SET)
+                    msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+                os.close(fd)
+
+    def _read(self) -> dict:
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                sessions = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+        return sessions if isinstance(sessions, dict) else {}
+
+    def _write(self, sessions: dict):
+        now = time.time()
+        sessions = {identity: session for identity, session in sessions.items() if session.get('expires', 0) > now}
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self.path)), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:  # mkstemp creates the file with mode 0o600
+                json.dump(sessions, f)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+    def load(self, identity: str) -> str | None:
+        """
+        :param identity: (str) Login identity, see `API._session_identity`
+        :return: (str) Stored API key, None if there is none or it expires soon
+        """
+        with self._locked():
+            session = self._read().get(identity)
+        if not isinstance(session, dict) or session.get('expires', 0) - self.safety_margin <= time.time():
+            return None
+        return session.get('apiKey')
+
+    def save(self, identity: str, api_key: str):
+        with self._locked():
+            sessions = self._read()
+            sessions[identity] = {'apiKey': api_key, 'expires': time.time() + self.key_lifetime}
+            self._write(sessions)
+        self._touched[identity] = time.time()
+
+    def touch(self, identity: str, api_key: str):
+        """
+        Records that `api_key` has just been used. Does nothing if it was recorded less than `touch_interval` seconds
+        ago, or if another process has replaced the key in the meantime.
+        """
+        if not self.touch_due(identity):
+            return
+        now = time.time()
+        self._touched[identity] = now
+        with self._locked():
+            sessions = self._read()
+            session = sessions.get(identity)
+            if isinstance(session, dict) and session.get('apiKey') == api_key:
+                session['expires'] = now + self.key_lifetime
+                self._write(sessions)
+
+    def touch_due(self, identity: str) -> bool:
+        """
+        :return: (bool) True if `touch` would update the file, False if the key was recorded less than `touch_interval`
+                 seconds ago
+        """
+        return time.time() - self._touched.get(identity, 0) >= self.touch_interval
+
+    def remove(self, identity: str):
+        with self._locked():
+            sessions = self._read()
+            if sessions.pop(identity, None) is not None:
+                self._write(sessions)
+        self._touched.pop(identity, None)
@@ -0,0 +1,99 @@
+"""
+Implementation date: 17.10.2026
+
+Single-flight coalescing: concurrent identical calls share one in-flight request and all receive its result (or its
+exception). Note that the callers receive the very same response dictionary, do not modify it in place.
+"""
+import asyncio
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+
+from .clientErrors import DeadlineExceeded
+
+
+class SingleFlight:
+    """
+    Thread-based implementation, used by `API`.
+    """
+
+    def __init__(self):
+        self.calls = {}  # key -> Future of the call in flight
+        self._lock = threading.Lock()
+
+    def do(self, key: str, function, timeout: float | None = None):
+        """
+        Calls `function()`, unless a call with the same key is already in flight: then waits for its result.
+        :param key: (str) Identifies identical calls
+        :param function: Function without arguments making the call
+        :param timeout: (float) Maximum number of seconds to wait for the call of another thread
+        :return: Result of the call
+        :raise DeadlineExceeded: if the call of another thread did not finish within `timeout`
+        """
+        with self._lock:
+            future = self.calls.get(key)
+            leader = future is None
+            if leader:
+                future = self.calls[key] = Future()
+        if not leader:
+            try:
+                return future.result(timeout)
+            except FutureTimeoutError:
+                if not future.done():
+                    raise DeadlineExceeded(f'Deadline exceeded while waiting for the identical call in flight: {key}')
+                raise
+        try:
+            result = function()
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self.calls[key]
+
+
+class AsyncSingleFlight:
+    """
+    Asyncio implementation, used by `AsyncAPI`.
+    """
+
+    def __init__(self):
+        self.calls = {}  # key -> asyncio.Future of the call in flight
+
+    async def do(self, key: str, coroutine_function, timeout: float | None = None):
+        """
+        Awaits `coroutine_function()`, unless a call with the same key is already in flight: then waits for its result.
+        :param key: (str) Identifies identical calls
+        :param coroutine_function: Coroutine function without arguments making the call
+        :param timeout: (float) Maximum number of seconds to wait for the call of another task
+        :return: Result of the call
+        :raise DeadlineExceeded: if the call of another task did not finish within `timeout`
+        """
+        while key in self.calls:
+            future = self.calls[key]
+            try:
+                return await asyncio.wait_for(asyncio.shield(future), timeout)
+            except asyncio.TimeoutError:
+                if not future.done():
+                    raise DeadlineExceeded(f'Deadline exceeded while waiting for the identical call in flight: {key}')
+                raise
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise  # this task was cancelled, not the one making the call
+        future = self.calls[key] = asyncio.get_running_loop().create_future()
+        try:
+            result = await coroutine_function()
+        except asyncio.CancelledError:
+            future.cancel()  # the waiting tasks will make the call themselves
+            raise
+        except BaseException as error:
+            future.set_exception(error)
+            future.exception()  # mark as retrieved: nobody may be waiting
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self.calls[key]
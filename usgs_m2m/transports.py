@@ -0,0 +1,278 @@
+"""
+Implementation date: 17.10.2026
+
+HTTP transports used by `API` (and `otherMethods._download`). A transport sends the requests and returns
+response objects with the `requests.Response` interface used by the client: `status_code`, `headers`, `content`,
+`raise_for_status()`, `iter_content()` and the context manager protocol. Pass one with `API(transport=...)`:
+
+    with API(transport=RecordReplayTransport('cassettes', mode='record')) as api:  # online, saves every response
+        ...
+    with API(transport=RecordReplayTransport('cassettes')) as api:  # offline, serves the saved responses
+        ...
+"""
+import gzip
+import hashlib
+import json
+import os
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from .clientErrors import RecordingNotFound
+
+try:
+    import httpx
+except ImportError:  # optional dependency
+    httpx = None
+
+try:
+    import h2
+except ImportError:  # optional dependency
+    h2 = None
+
+
+class Transport:
+    """
+    Interface of the transports. `timeout` is a number of seconds or a (connect, read) tuple, as in `requests`.
+    """
+
+    def post(self, url: str, data: bytes | None = None, headers: dict | None = None,
+             timeout: float | tuple | None = None, stream: bool = False):
+        raise NotImplementedError
+
+    def get(self, url: str, headers: dict | None = None, timeout: float | tuple | None = None,
+            stream: bool = False, allow_redirects: bool = True):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class RequestsTransport(requests.Session, Transport):
+    """
+    Default transport: a `requests.Session` keeping up to `pool_size` connections alive per host.
+    """
+
+    def __init__(self, pool_size: int = 10):
+        """
+        :param pool_size: (int) Maximum number of keep-alive connections per host
+        """
+        super().__init__()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.mount('https://', adapter)
+        self.mount('http://', adapter)
+
+
+class HttpxResponse:
+    """
+    Gives an `httpx.Response`, streamed or not, the `requests.Response` interface used by the client. Like with
+    `requests`, `raise_for_status` raises `requests.HTTPError` for 4xx and 5xx statuses only, so that USGS errors and
+    retries are handled the same way whatever the transport.
+    """
+
+    def __init__(self, response: 'httpx.Response'):
+        self.response = response
+        self.status_code = response.status_code
+        self.headers = response.headers
+        self.url = str(response.url)
+
+    @property
+    def content(self) -> bytes:
+        return self.response.read()
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            kind = 'Client' if self.status_code < 500 else 'Server'
+            raise requests.HTTPError(f'{self.status_code} {kind} Error: {self.response.reason_phrase} for url: '
+                                     f'{self.url}', response=self)
+
+    def iter_content(self, chunk_size: int = 1024):
+        return self.response.iter_bytes(chunk_size)
+
+    def close(self):
+        self.response.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class Http2Transport(Transport):
+    """
+    Multiplexes concurrent requests as HTTP/2 streams over a few connections instead of using one socket per request
+    in flight. If the server does not negotiate HTTP/2 (ALPN), requests are sent over HTTP/1.1 keep-alive connections.
+    Requires `httpx` with HTTP/2 support: pip install httpx[http2]
+    """
+
+    def __init__(self, pool_size: int = 10):
+        """
+        :param pool_size: (int) Maximum number of connections, used only when falling back to HTTP/1.1
+        """
+        if httpx is None or h2 is None:
+            raise ImportError('Http2Transport requires `httpx` with HTTP/2 support: pip install httpx[http2]')
+        limits = httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+        self.client = httpx.Client(http2=True, limits=limits, timeout=None)
+
+    @staticmethod
+    def _timeout(timeout: float | tuple | None) -> 'httpx.Timeout':
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return httpx.Timeout(read, connect=connect)
+        return httpx.Timeout(timeout)
+
+    def post(self, url: str, data: bytes | None = None, headers: dict | None = None,
+             timeout: float | tuple | None = None, stream: bool = False) -> HttpxResponse:
+        request = self.client.build_request('POST', url, content=data, headers=headers, timeout=self._timeout(timeout))
+        return HttpxResponse(self.client.send(request, stream=stream))
+
+    def get(self, url: str, headers: dict | None = None, timeout: float | tuple | None = None,
+            stream: bool = False, allow_redirects: bool = True) -> HttpxResponse:
+        request = self.client.build_request('GET', url, headers=headers, timeout=self._timeout(timeout))
+        response = self.client.send(request, stream=stream, follow_redirects=allow_redirects)
+        return HttpxResponse(response)
+
+    def close(self):
+        self.client.close()
+
+
+class ReplayResponse:
+    """
+    Response served by `RecordReplayTransport`, with the `requests.Response` interface.
+    """
+
+    def __init__(self, url: str, status_code: int, headers: dict, content: bytes):
+        self.url = url
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers)
+        self.content = content
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f'{self.status_code} Error (replayed) for url: {self.url}', response=self)
+
+    def iter_content(self, chunk_size: int = 1024):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start:start + chunk_size]
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+
+class RecordReplayTransport(Transport):
+    """
+    Stores request/response pairs in `directory` and serves them offline, e.g. to benchmark or profile the client
+    without network. A request is identified by its method, URL and (uncompressed) body; headers such as the API key
+    are ignored. Identical requests are answered with the responses in the order they were recorded, the last one is
+    repeated once they are exhausted.
+
+    Each response is saved as two files named after the request hash and its rank: `<hash>.<n>.json` (URL, status,
+    headers) and `<hash>.<n>.body` (raw body).
+
+    Modes:
+        replay - only serve recorded responses, `RecordingNotFound` is raised for an unknown request
+        record - send every request with `transport` and save the response, replacing previous recordings
+        auto - serve the recorded responses, send and record the unknown requests
+    """
+    modes = ('replay', 'record', 'auto')
+    recorded_headers = ('Content-Type', 'Content-Disposition', 'Content-Length', 'Retry-After')
+
+    def __init__(self, directory: str, mode: str = 'replay', transport: Transport | None = None):
+        """
+        :param directory: (str) Directory of the recordings, created if it does not exist
+        :param mode: (str) 'replay', 'record' or 'auto'
+        :param transport: (Transport) Transport sending the requests in 'record' and 'auto' modes, defaults to
+                                      `RequestsTransport()`
+        """
+        if mode not in self.modes:
+            raise ValueError(f'Unknown record/replay mode: {mode}. Use one of: {", ".join(self.modes)}')
+        self.directory = directory
+        self.mode = mode
+        self.transport = transport
+        if mode != 'replay' and self.transport is None:
+            self.transport = RequestsTransport()
+        os.makedirs(directory, exist_ok=True)
+        self._counters = {}  # request hash -> number of responses already served or recorded
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def request_hash(method: str, url: str, data: bytes | None = None, headers: dict | None = None) -> str:
+        """
+        :return: (str) Hash identifying the request, independent of the compression of the body
+        """
+        if data and CaseInsensitiveDict(headers or {}).get('Content-Encoding') == 'gzip':
+            data = gzip.decompress(data)
+        digest = hashlib.sha256(f'{method} {url}\n'.encode('utf-8'))
+        digest.update(data or b'')
+        return digest.hexdigest()
+
+    def _path(self, key: str, rank: int) -> str:
+        return os.path.join(self.directory, f'{key}.{rank}')
+
+    def _next_rank(self, key: str) -> int:
+        with self._lock:
+            rank = self._counters.get(key, 0)
+            self._counters[key] = rank + 1
+            return rank
+
+    def _load(self, key: str, rank: int) -> ReplayResponse | None:
+        while rank > 0 and not os.path.isfile(self._path(key, rank) + '.json'):
+            rank -= 1  # repeat the last recorded response
+        path = self._path(key, rank)
+        if not os.path.isfile(path + '.json'):
+            return None
+        with open(path + '.json', encoding='utf-8') as f:
+            meta = json.load(f)
+        with open(path + '.body', 'rb') as f:
+            content = f.read()
+        return ReplayResponse(meta['url'], meta['status_code'], meta['headers'], content)
+
+    def _save(self, key: str, rank: int, method: str, url: str, response) -> ReplayResponse:
+        content = response.content
+        headers = {name: response.headers[name] for name in self.recorded_headers if name in response.headers}
+        if 'Content-Length' in headers:  # `content` is already decompressed
+            headers['Content-Length'] = str(len(content))
+        path = self._path(key, rank)
+        with open(path + '.body', 'wb') as f:
+            f.write(content)
+        with open(path + '.json', 'w', encoding='utf-8') as f:
+            json.dump({'method': method, 'url': url, 'status_code': response.status_code, 'headers': headers}, f,
+                      indent=2)
+        response.close()
+        return ReplayResponse(url, response.status_code, headers, content)
+
+    def _request(self, method: str, url: str, data: bytes | None, headers: dict | None, send) -> ReplayResponse:
+        key = self.request_hash(method, url, data, headers)
+        rank = self._next_rank(key)
+        if self.mode != 'record':
+            response = self._load(key, rank)
+            if response is not None:
+                return response
+            if self.mode == 'replay':
+                raise RecordingNotFound(f'No recorded response for {method} {url}')
+        return self._save(key, rank, method, url, send())
+
+    def post(self, url: str, data: bytes | None = None, headers: dict | None = None,
+             timeout: float | tuple | None = None, stream: bool = False) -> ReplayResponse:
+        return self._request('POST', url, data, headers,
+                             lambda: self.transport.post(url, data=data, headers=headers, timeout=timeout,
+                                                         stream=stream))
+
+    def get(self, url: str, headers: dict | None = None, timeout: float | tuple | None = None,
+            stream: bool = False, allow_redirects: bool = True) -> ReplayResponse:
+        return self._request('GET', url, None, headers,
+                             lambda: self.transport.get(url, headers=headers, timeout=timeout, stream=stream,
+                                                        allow_redirects=allow_redirects))
+
+    def close(self):
+        if self.transport is not None:
+            self.transport.close()
@@ -1,6 +1,40 @@
-import requests
+import gzip
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from itertools import islice
+from typing import Any, Iterable, Iterator, NamedTuple
 from warnings import warn
 from .checkResponse import _check_response
+from .circuitBreaker import CircuitBreaker
+from .clientErrors import DeadlineExceeded, CircuitOpenError, PaginationError
+from .diskCache import DiskCache
+from .hedging import HedgePolicy
+from .usgsErrors import INPUT_FORMAT, AUTH_KEY_INVALID
+from .jsonCodec import JsonCodec, get_json_codec, strip_none, payload_hash
+from .rateLimiter import RateLimiter
+from .responseCache import ResponseCache
+from .resultsStream import ResultsStream
+from .retryPolicy import RetryPolicy
+from .sceneMetadataCache import SceneMetadataCache
+from .sessionStore import SessionStore
+from .singleFlight import SingleFlight
+from .transports import Transport, RequestsTransport, Http2Transport
+
+
+class MapResult(NamedTuple):
+    """
+    One item yielded by `API.map`.
+    :param index: (int) Position of the item in the input iterable
+    :param kwargs: (dict) Keyword arguments the method was called with
+    :param result: (dict) Response as a dictionary, None if the call failed
+    :param error: (Exception) Exception raised by the call, None if the call succeeded
+    """
+    index: int
+    kwargs: dict
+    result: Any
+    error: Exception | None
 
 
 # noinspection PyPep8Naming
@@ -19,32 +53,684 @@ class API:
     apiURL = r'https://m2m.cr.usgs.gov/api/api/json/stable/'  # must ends with slash: "/"
     apiKey = None
     loud_mode = False
-
-    def __send_request_and_check_it(self, url: str, json_payload: dict) -> dict:
+    strip_none = True  # drop None values from payloads before sending them
+    keep_none_endpoints = set()  # endpoints (e.g. 'dataset-clear-customization') whose payloads are sent unchanged
+    compress_threshold = 64 * 1024  # gzip request bodies of at least this many bytes, None disables compression
+    compress_level = 6
+    compression_rejected_statuses = {415}  # HTTP statuses meaning the server could not read a compressed body
+    timeout = (10, 120)  # (connect, read) timeouts in seconds of a single HTTP request
+    endpoint_timeouts = {'scene-search': (10, 600),  # per-endpoint (connect, read) timeouts, override `timeout`
+                         'scene-search-delete': (10, 600),
+                         'scene-search-secondary': (10, 600),
+                         'scene-metadata-list': (10, 600),
+                         }
+    read_only_endpoints = {'data-owner', 'dataset', 'dataset-browse', 'dataset-bulk-products', 'dataset-catalogs',
+                           'dataset-categories', 'dataset-coverage', 'dataset-download-options', 'dataset-file-groups',
+                           'dataset-filters', 'dataset-get-customization', 'dataset-get-customizations',
+                           'dataset-messages', 'dataset-metadata', 'dataset-order-products', 'dataset-search',
+                           'download-eula', 'download-labels', 'download-options', 'download-search', 'grid2ll',
+                           'notifications', 'order-products', 'permissions', 'placename', 'rate-limit-summary',
+                           'scene-list-get', 'scene-list-summary', 'scene-list-types', 'scene-metadata',
+                           'scene-metadata-list', 'scene-metadata-xml', 'scene-search', 'scene-search-delete',
+                           'scene-search-secondary', 'tram-order-details', 'tram-order-search', 'tram-order-status',
+                           'tram-order-units', 'user-preference-get',
+                           }  # endpoints without side effects, identical concurrent calls to them are coalesced
+    uncached_parameters = ('bulkListName', 'compareListName', 'excludeListName', 'orderListName',
+                           'useCustomization')  # responses depending on server-side state are never cached
+    renew_api_key = True  # log in again and replay the request once when the API key has expired
+    renewable_login_endpoints = {'login', 'login-token'}  # logins whose payload can be sent again
+    expired_key_errors = (AUTH_KEY_INVALID,)  # AUTH_UNAUTHROIZED is a missing permission, a new key does not help
+    deadline = None  # default time budget in seconds for a whole call, retries included; None means no deadline
+    endpoint_deadlines = {}  # per-endpoint default deadlines, override `deadline`
+
+    def __init__(self, pool_size: int = 10, json_codec: str | JsonCodec = 'json',
+                 retry_policy: RetryPolicy | None = None, rate_limiter: RateLimiter | None = None,
+                 circuit_breaker: CircuitBreaker | None = None, coalesce_requests: bool = True,
+                 hedging: HedgePolicy | None = None, http2: bool = False, transport: Transport | None = None,
+                 session_store: SessionStore | None = None, response_cache: ResponseCache | None = None,
+                 disk_cache: DiskCache | None = None, scene_metadata_cache: SceneMetadataCache | None = None):
+        """
+        :param pool_size: (int) Maximum number of keep-alive connections kept open to the API host. Set it to the
+                                number of threads that share this instance.
+        :param json_codec: (str | JsonCodec) Codec used to encode payloads and decode responses: 'json', 'orjson',
+                                             'auto' (fastest installed) or a `JsonCodec` instance
+        :param retry_policy: (RetryPolicy) Which failures are retried and how long to wait, defaults to `RetryPolicy()`.
+                                           Use `RetryPolicy(max_attempts=1)` to disable retries
+        :param rate_limiter: (RateLimiter) Throttles requests and download requests to stay under the USGS rate
+                                           limits, None (default) sends requests as fast as possible
+        :param circuit_breaker: (CircuitBreaker) Fails fast on endpoints that keep failing, None (default) disables it.
+                                                 See `circuit_breaker.states()` for the state of every endpoint
+        :param coalesce_requests: (bool) Identical concurrent calls to `read_only_endpoints` share one request and
+                                         receive the same response dictionary
+        :param hedging: (HedgePolicy) Sends a second identical request when a read-only call is slower than usual,
+                                      None (default) disables it
+        :param http2: (bool) Multiplex requests over HTTP/2 connections (falls back to HTTP/1.1 if the server does not
+                             support it), requires `httpx[http2]`
+        :param transport: (Transport) Sends the HTTP requests, e.g. a `RecordReplayTransport` to work offline.
+                                      Defaults to `RequestsTransport(pool_size)`, or `Http2Transport` if `http2`
+        :param session_store: (SessionStore) Shares API keys between processes: `login` and `loginToken` reuse a
+                                             stored key instead of sending a request. None (default) disables it
+        :param response_cache: (ResponseCache) Caches the responses of near-static read-only endpoints such as
+                                               `dataset`, and NOT_FOUND errors and unavailable products for a short time.
+                                               None (default) disables it
+        :param disk_cache: (DiskCache) Caches responses on disk, shared between processes and reruns. Checked after
+                                       `response_cache`, None (default) disables it
+        :param scene_metadata_cache: (SceneMetadataCache) Caches `sceneMetadata` and `sceneMetadataXML` per scene,
+                                                          None (default) disables it
+        """
+        self.pool_size = pool_size
+        self.http2 = http2
+        self.transport = transport
+        self.json_codec = get_json_codec(json_codec)
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.single_flight = SingleFlight() if coalesce_requests else None
+        self.hedging = hedging
+        self.read_only_endpoints = set(self.read_only_endpoints)
+        self.keep_none_endpoints = set(self.keep_none_endpoints)
+        self.uncompressed_endpoints = set()  # endpoints that rejected a compressed body
+        self.endpoint_timeouts = dict(self.endpoint_timeouts)
+        self.endpoint_deadlines = dict(self.endpoint_deadlines)
+        self.session_store = session_store
+        self.response_cache = response_cache
+        self.disk_cache = disk_cache
+        self.scene_metadata_cache = scene_metadata_cache
+        self._login_request = None  # (url, json_payload) of the last renewable login
+        self._session_identity = None  # identity of the current key in `session_store`
+        self._cache_user = None  # user of the current key, scopes the cached responses
+        self._renew_lock = threading.Lock()
+        self.session = self._create_session(pool_size)
+
+    def _create_session(self, pool_size: int) -> Transport:
+        if self.transport is not None:
+            return self.transport
+        if self.http2:
+            return Http2Transport(pool_size)
+        return RequestsTransport(pool_size)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Closes all pooled connections. The API key is not destroyed, call `logout` for that.
+        """
+        self.session.close()
+        if self.hedging is not None:
+            self.hedging.close()
+
+    def _get_api_method(self, method_name: str):
+        method = getattr(self, method_name, None)
+        if method_name.startswith('_') or not callable(method):
+            raise ValueError(f'Unknown API method: {method_name}')
+        return method
+
+    def map(self, method_name: str, kwargs_iterable: Iterable[dict], max_workers: int | None = None,
+            ordered: bool = True) -> Iterator[MapResult]:
+        """
+        Calls an API method once per set of keyword arguments on a bounded thread pool. Errors are captured per item
+        and never stop the batch: check `MapResult.error`. The input iterable is consumed lazily, so it can be a
+        generator of any length.
+        Example: api.map('sceneMetadata', ({'datasetName': datasetName, 'entityId': e} for e in entityIds))
+        :param method_name: (str) Name of the API method to call, e.g. 'sceneMetadata', 'downloadOptions'
+        :param kwargs_iterable: (iterable of dict) Keyword arguments for every call
+        :param max_workers: (int) Number of worker threads, defaults to `pool_size`
+        :param ordered: (bool) Yield results in input order if True, or as soon as they complete if False
+        :return: (generator of MapResult)
+        """
+        method = self._get_api_method(method_name)
+        max_workers = max_workers or self.pool_size
+        items = enumerate(kwargs_iterable)
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+
+        def submit(count):
+            return [executor.submit(self._map_call, method, index, kwargs) for index, kwargs in islice(items, count)]
+
+        try:
+            if ordered:
+                futures = deque(submit(2 * max_workers))
+                while futures:
+                    result = futures.popleft().result()
+                    futures.extend(submit(1))
+                    yield result
+            else:
+                futures = set(submit(2 * max_workers))
+                while futures:
+                    done, futures = wait(futures, return_when=FIRST_COMPLETED)
+                    futures.update(submit(len(done)))
+                    for future in done:
+                        yield future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    def _map_call(method, index: int, kwargs: dict) -> MapResult:
+        try:
+            return MapResult(index, kwargs, method(**kwargs), None)
+        except Exception as error:
+            return MapResult(index, kwargs, None, error)
+
+    def iter_scenes(self, datasetName: str, sceneFilter: dict | None = None, page_size: int = 5000,
+                    prefetch: bool = True, max_workers: int | None = None, deadline: float | None = None,
+                    **search_kwargs) -> Iterator[dict]:
+        """
+        Yields the scenes of a `sceneSearch` one at a time, walking `startingNumber` page by page until `totalHits` is
+        reached. While the scenes of a page are consumed, the next page is requested in a background thread.
+        Example: for scene in api.iter_scenes('landsat_ot_c2_l1', sceneFilter=sceneFilter): ...
+        :param datasetName: (str) Dataset alias
+        :param sceneFilter: (SceneFilter) Used to filter data within the dataset
+        :param page_size: (int) `maxResults` of every page, at most 50,000
+        :param prefetch: (bool) Request the next page while the current one is consumed
+        :param max_workers: (int) Once the first page gave an exact `totalHits`, request the other pages concurrently on
+                                  this many threads. Scenes are still yielded in order, and PaginationError is raised if
+                                  a page misses or repeats scenes (pass a `sortField` for a stable order). None
+                                  (default) requests one page at a time
+        :param deadline: (float) Time budget in seconds of every page, retries included
+        :param search_kwargs: Other `sceneSearch` parameters, e.g. metadataType, sortField, sortDirection
+        :return: (generator of dict) Scenes of `data.results`
+        """
+        def page(startingNumber):
+            return self.sceneSearch(datasetName, maxResults=page_size, startingNumber=startingNumber,
+                                    sceneFilter=sceneFilter, deadline=deadline, **search_kwargs)['data'] or {}
+
+        data = page(1)
+        if max_workers is not None and max_workers > 1 and self._windows_known(data):
+            yield from self._iter_scene_windows(data, page, max_workers)
+            return
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='iter_scenes') if prefetch else None
+        try:
+            startingNumber = 1
+            while True:
+                nextNumber = self._next_starting_number(data, startingNumber, page_size)
+                future = executor.submit(page, nextNumber) if executor is not None and nextNumber else None
+                yield from data.get('results') or []
+                if nextNumber is None:
+                    return
+                data = future.result() if future is not None else page(nextNumber)
+                startingNumber = nextNumber
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    def _iter_scene_windows(self, first: dict, page, max_workers: int) -> Iterator[dict]:
+        """
+        Requests the pages after `first` concurrently, at most `2 * max_workers` ahead of the one being consumed, and
+        yields their scenes in order.
+        :param first: (dict) 'data' of the first page, the size of its results is the size of every window
+        :param page: (callable) startingNumber -> 'data' of the page
+        """
+        totalHits, window = first['totalHits'], len(first['results'])
+        starts = iter(range(1 + window, totalHits + 1, window))
+        seen = set()
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='iter_scenes')
+
+        def submit(count):
+            return [(startingNumber, executor.submit(page, startingNumber)) for startingNumber in islice(starts, count)]
+
+        try:
+            futures = deque(submit(2 * max_workers))
+            startingNumber, data = 1, first
+            while True:
+                self._check_window(data, startingNumber, window, totalHits, seen)
+                yield from data['results']
+                if not futures:
+                    return
+                startingNumber, future = futures.popleft()
+                futures.extend(submit(1))
+                data = future.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _windows_known(data: dict) -> bool:
+        """
+        :return: (bool) True if the first page of a search gives the windows of the next ones: an exact `totalHits`
+                 and at least one scene
+        """
+        return (isinstance(data.get('totalHits'), int) and data.get('totalHitsAccuracy') != 'approximate'
+                and bool(data.get('results')))
+
+    @staticmethod
+    def _check_window(data: dict, startingNumber: int, window: int, totalHits: int, seen: set):
+        """
+        :param seen: (set) entityIds of the previous windows, updated with those of this one
+        :raise: PaginationError if the window does not hold the expected number of new scenes
+        """
+        results = data.get('results') or []
+        if data.get('totalHits') != totalHits:
+            raise PaginationError(f'totalHits changed from {totalHits} to {data.get("totalHits")} during the search')
+        expected = min(window, totalHits - startingNumber + 1)
+        if len(results) != expected:
+            raise PaginationError(f'The page starting at {startingNumber} holds {len(results)} scenes instead of '
+                                  f'{expected}')
+        entityIds = [scene.get('entityId') for scene in results if isinstance(scene, dict)]
+        previous = len(seen)
+        seen.update(entityIds)
+        if len(seen) - previous != len(entityIds):
+            raise PaginationError(f'The page starting at {startingNumber} repeats {previous + len(entityIds) - len(seen)} '
+                                  f'scenes. Pass a `sortField` for a stable order')
+
+    @staticmethod
+    def _next_starting_number(data: dict, startingNumber: int, page_size: int) -> int | None:
+        """
+        :param data: (dict) 'data' of a `sceneSearch` response
+        :return: (int) `startingNumber` of the next page, None if `data` is the last one
+        """
+        results = data.get('results') or []
+        received = startingNumber + len(results)
+        nextRecord = data.get('nextRecord')
+        if not isinstance(nextRecord, int) or nextRecord < received:  # never request received records again
+            nextRecord = received
+        if not results or len(results) < page_size and nextRecord == received:
+            return None
+        totalHits = data.get('totalHits')
+        if isinstance(totalHits, int) and nextRecord > totalHits and data.get('totalHitsAccuracy') != 'approximate':
+            return None  # an approximate count is not trusted to end the walk
+        return nextRecord
+
+    def _headers(self, auth: bool = True) -> dict:
+        headers = {'Content-Type': 'application/json', 'Accept-Encoding': 'gzip, deflate'}
+        if auth and self.apiKey is not None:
+            headers['X-Auth-Token'] = self.apiKey
+        return headers
+
+    def _endpoint(self, url: str) -> str:
+        return url[len(self.apiURL):]
+
+    def _encode_payload(self, url: str, json_payload: dict | None) -> bytes | None:
+        if json_payload is None:
+            return None
+        if self.strip_none and self._endpoint(url) not in self.keep_none_endpoints:
+            json_payload = strip_none(json_payload)
+        return self.json_codec.dumps(json_payload)
+
+    def _should_compress(self, url: str, body: bytes | None) -> bool:
+        return (body is not None and self.compress_threshold is not None and len(body) >= self.compress_threshold
+                and self._endpoint(url) not in self.uncompressed_endpoints)
+
+    def _compressed_request(self, body: bytes, headers: dict) -> tuple[bytes, dict]:
+        return gzip.compress(body, compresslevel=self.compress_level), {**headers, 'Content-Encoding': 'gzip'}
+
+    def _expiry(self, url: str, deadline: float | None) -> float | None:
+        """
+        :return: `time.monotonic()` value at which the call must be finished, None if it has no deadline
+        """
+        if deadline is None:
+            deadline = self.endpoint_deadlines.get(self._endpoint(url), self.deadline)
+        return None if deadline is None else time.monotonic() + deadline
+
+    @staticmethod
+    def _remaining(expiry: float | None) -> float | None:
+        return None if expiry is None else max(0.0, expiry - time.monotonic())
+
+    def _timeout(self, url: str, expiry: float | None) -> tuple[float, float]:
+        """
+        :return: (connect, read) timeouts of the next HTTP request, shortened to the time left before `expiry`
+        """
+        timeout = self.endpoint_timeouts.get(self._endpoint(url), self.timeout)
+        if not isinstance(timeout, tuple):
+            timeout = (timeout, timeout)
+        if expiry is None:
+            return timeout
+        remaining = expiry - time.monotonic()
+        if remaining <= 0:
+            raise DeadlineExceeded(f'Deadline exceeded before sending the request to {url}')
+        return min(timeout[0], remaining), min(timeout[1], remaining)
+
+    def _post(self, url: str, json_payload: dict | None = None, auth: bool = True, expiry: float | None = None,
+              stream: bool = False) -> dict | ResultsStream:
+        """Protected function to encode the payload, send it (gzip-compressed if it is large) and check the response.
+        If the server rejects a compressed body (HTTP 415 or INPUT_FORMAT), it is sent again uncompressed. If that
+        succeeds, the endpoint is added to `uncompressed_endpoints`, so later requests to it are not compressed.
+        :param url: request URL
+        :param json_payload: payload as dictionary, None to send an empty body
+        :param auth: send the API key in the 'X-Auth-Token' header
+        :param expiry: `time.monotonic()` value at which the call must be finished, see `_expiry`
+        :param stream: return a `ResultsStream` reading the body incrementally instead of a dictionary
+        :return: response as dictionary
+        """
+        body = self._encode_payload(url, json_payload)
+        headers = self._headers(auth)
+        if self._should_compress(url, body):
+            compressed_body, compressed_headers = self._compressed_request(body, headers)
+            response = self.session.post(url, data=compressed_body, headers=compressed_headers,
+                                         timeout=self._timeout(url, expiry), stream=stream)
+            if response.status_code not in self.compression_rejected_statuses:
+                try:
+                    return self._read_response(response, stream)
+                except INPUT_FORMAT:
+                    pass
+            response.close()  # a streamed response holds a pooled connection
+            content = self._send_uncompressed(url, body, headers, expiry, stream)
+            self.uncompressed_endpoints.add(self._endpoint(url))
+            return content
+        return self._send_uncompressed(url, body, headers, expiry, stream)
+
+    def _send_uncompressed(self, url: str, body: bytes | None, headers: dict, expiry: float | None,
+                           stream: bool) -> dict | ResultsStream:
+        response = self.session.post(url, data=body, headers=headers, timeout=self._timeout(url, expiry),
+                                     stream=stream)
+        return self._read_response(response, stream)
+
+    def _read_response(self, response, stream: bool = False) -> dict | ResultsStream:
+        if stream and response.status_code < 400:
+            return ResultsStream(response)
+        return _check_response(response, self.json_codec.loads)
+
+    def _post_with_retries(self, url: str, json_payload: dict | None = None, auth: bool = True,
+                           expiry: float | None = None, stream: bool = False) -> dict | ResultsStream:
+        """Protected function to call `_post` until it succeeds or `retry_policy` gives up. A stream is only retried
+        until its first result, errors raised while iterating it are not. If the API key has expired, the client logs
+        in again and replays the request once, see `renew_api_key`.
+        :return: response as dictionary
+        """
+        endpoint = self._endpoint(url)
+        attempt = 1
+        renewed = False
+        while True:
+            api_key = self.apiKey
+            try:
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.before_request(endpoint)
+                self._admit(endpoint, json_payload, expiry)
+                content = self._post(url, json_payload, auth, expiry, stream)
+            except CircuitOpenError:
+                raise
+            except Exception as error:
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record(endpoint, error)  # also releases a half-open probe before a replay
+                if not renewed and self._can_renew(error, auth):
+                    self._renew(api_key, expiry)
+                    renewed = True
+                    continue
+                delay = self.retry_policy.next_delay(endpoint, error, attempt, expiry)
+                if delay is None:
+                    raise
+                if self.loud_mode:
+                    print(f'Attempt {attempt} of {endpoint} failed ({error!r}), retrying in {delay:.1f} s')
+                time.sleep(delay)
+                attempt += 1
+            else:
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record(endpoint)
+                if self.rate_limiter is not None and not stream:
+                    self.rate_limiter.observe(endpoint, content)
+                if auth and self._session_identity is not None:
+                    self.session_store.touch(self._session_identity, self.apiKey)
+                return content
+
+    def _can_renew(self, error: Exception, auth: bool) -> bool:
+        return (auth and self.renew_api_key and self._login_request is not None
+                and isinstance(error, self.expired_key_errors))
+
+    def _renew(self, expired_key: str | None, expiry: float | None = None):
+        """Protected function to log in again with the last login request. Only the first caller seeing `expired_key`
+        logs in, concurrent callers wait for it and then use the new key.
+        """
+        with self._renew_lock:
+            if self.apiKey != expired_key or self._load_renewed_key(expired_key):
+                return
+            url, json_payload = self._login_request
+            content = self._post_with_retries(url, json_payload, auth=False, expiry=expiry)
+            self.apiKey = content['data']
+            self._remember_login(url, json_payload)
+        if self.loud_mode:
+            print(f'API key renewed: {self.apiKey}')
+
+    def _admit(self, endpoint: str, json_payload: dict | None, expiry: float | None):
+        """Protected function to wait until `rate_limiter` lets a request through.
+        """
+        if self.rate_limiter is None:
+            return
+        delay = self.rate_limiter.reserve(endpoint, json_payload)
+        if delay > 0:
+            if expiry is not None and time.monotonic() + delay >= expiry:
+                raise DeadlineExceeded(f'Deadline exceeded while waiting for the rate limiter ({endpoint})')
+            time.sleep(delay)
+
+    def _calibration_due(self, endpoint: str) -> bool:
+        return (self.rate_limiter is not None and endpoint != 'rate-limit-summary' and self.apiKey is not None
+                and self.rate_limiter.calibration_due())
+
+    def _calibrate_rate_limits(self, endpoint: str, expiry: float | None = None):
+        """Protected function to recalibrate the download limits of `rate_limiter` with `rateLimitSummary` when they
+        are due. Only called from `_send_request_and_check_it`, never by logins or key renewals, so that no login lock
+        is held while it runs.
+        :param expiry: `time.monotonic()` deadline of the calling request, the calibration counts against it
+        """
+        if not self._calibration_due(endpoint):
+            return
+        try:
+            self.rateLimitSummary(deadline=self._remaining(expiry))
+        except Exception as error:
+            if self.loud_mode:
+                print(f'Rate limits calibration failed: {error!r}')
+
+    def _send_request_and_check_it(self, url: str, json_payload: dict, deadline: float | None = None) -> dict:
         """Protected function to send request, check it and return response. Used in almost every method in this API.
         :param url: request URL
         :param json_payload: `requests` json payload.
+        :param deadline: time budget in seconds for the whole call
+        :return: response as dictionary
+        """
+        expiry = self._expiry(url, deadline)
+        endpoint = self._endpoint(url)
+        self._calibrate_rate_limits(endpoint, expiry)
+        if endpoint not in self.read_only_endpoints:
+            return self._post_with_retries(url, json_payload, expiry=expiry)
+        request_hash = self._request_hash(json_payload)
+        content = self._cached_response(endpoint, request_hash, json_payload)
+        if content is not None:
+            return content
+
+        def call():
+            try:
+                if self.hedging is not None and endpoint in self.hedging.endpoints:
+                    content = self.hedging.run(endpoint,
+                                               lambda: self._post_with_retries(url, json_payload, expiry=expiry),
+                                               timeout=self._remaining(expiry))
+                else:
+                    content = self._post_with_retries(url, json_payload, expiry=expiry)
+            except Exception as error:
+                self._cache_error(endpoint, request_hash, json_payload, error)
+                raise
+            self._cache_response(endpoint, request_hash, json_payload, content)
+            return content
+
+        if self.single_flight is None:
+            return call()
+        return self.single_flight.do(f'{endpoint}:{request_hash}', call, timeout=self._remaining(expiry))
+
+    def _request_hash(self, json_payload: dict | None) -> str:
+        """Protected function to identify a read-only request in the caches and for coalescing. Responses differ by
+        server and by user permissions, so `apiURL` and the logged-in user are part of the hash.
+        """
+        return payload_hash({'apiURL': self.apiURL, 'user': self._cache_user, 'payload': json_payload})
+
+    def _cacheable(self, json_payload: dict | None) -> bool:
+        return not json_payload or all(json_payload.get(parameter) is None for parameter in self.uncached_parameters)
+
+    def _cached_response(self, endpoint: str, request_hash: str, json_payload: dict | None = None) -> dict | None:
+        """Protected function to look a response up in `scene_metadata_cache`, `response_cache`, then `disk_cache`.
+        :return: cached response, None if there is none
+        :raise: the error remembered by `response_cache` for a request known to fail (e.g. NOT_FOUND)
+        """
+        if self.scene_metadata_cache is not None:
+            key = self.scene_metadata_cache.key_for_request(endpoint, json_payload)
+            metadata = self.scene_metadata_cache.get(key) if key is not None else None
+            if metadata is not None:
+                return {'requestId': None, 'version': None, 'sessionId': None, 'data': metadata, 'errorCode': None,
+                        'errorMessage': None}
+        if not self._cacheable(json_payload):
+            return None
+        if self.response_cache is not None:
+            error = self.response_cache.get_error(endpoint, request_hash)
+            if error is not None:
+                raise type(error)(*error.args)
+            content = self.response_cache.get(endpoint, request_hash)
+            if content is not None:
+                return content
+        if self.disk_cache is not None:
+            content = self.disk_cache.get(endpoint, request_hash)
+            if content is not None and self.response_cache is not None:
+                self.response_cache.set(endpoint, request_hash, content)
+            return content
+        return None
+
+    def _cache_response(self, endpoint: str, request_hash: str, json_payload: dict, content: dict):
+        if self.scene_metadata_cache is not None and content.get('data') is not None:
+            key = self.scene_metadata_cache.key_for_request(endpoint, json_payload)
+            if key is not None:
+                self.scene_metadata_cache.set(key, content['data'])
+        if not self._cacheable(json_payload):
+            return
+        if self.response_cache is not None:
+            self.response_cache.set(endpoint, request_hash, content)
+            if endpoint == 'download-options':
+                self.response_cache.record_download_options(json_payload, content)
+        if self.disk_cache is not None:
+            self.disk_cache.set(endpoint, request_hash, content, json_payload)
+
+    def _cache_error(self, endpoint: str, request_hash: str, json_payload: dict, error: Exception):
+        if self.response_cache is not None and self._cacheable(json_payload):
+            self.response_cache.set_error(endpoint, request_hash, error)
+
+    def _stream_request(self, url: str, json_payload: dict, deadline: float | None = None) -> ResultsStream:
+        """Protected function to send a request whose results are read incrementally. Streams are neither coalesced
+        nor hedged, and the deadline only covers the call up to the first result.
+        :return: (ResultsStream) Iterator over the results
+        """
+        return self._post_with_retries(url, json_payload, expiry=self._expiry(url, deadline), stream=True)
+
+    @staticmethod
+    def _scene_search_payload(datasetName, maxResults, startingNumber, metadataType, sortField, sortDirection,
+                              sortCustomization, useCustomization, sceneFilter, compareListName, bulkListName,
+                              orderListName, excludeListName, includeNullMetadataValues) -> dict:
+        """Protected function to build the payload shared by `sceneSearch` and `sceneSearchStream`.
+        :return: (dict) `requests` json payload
+        """
+        return {"datasetName": datasetName,
+                "maxResults": maxResults,
+                "startingNumber": startingNumber,
+                "metadataType": metadataType,
+                "sortField": sortField,
+                "sortDirection": sortDirection,
+                "sortCustomization": sortCustomization,
+                "useCustomization": useCustomization,
+                "sceneFilter": sceneFilter,
+                "compareListName": compareListName,
+                "bulkListName": bulkListName,
+                "orderListName": orderListName,
+                "excludeListName": excludeListName,
+                "includeNullMetadataValues": includeNullMetadataValues,
+                }
+
+    def _load_renewed_key(self, expired_key: str | None) -> bool:
+        """Protected function to take the key that another process has saved in `session_store` after renewing it.
+        :return: True if a new key was loaded
+        """
+        if self._session_identity is None:
+            return False
+        api_key = self.session_store.load(self._session_identity)
+        if api_key is None or api_key == expired_key:
+            return False
+        self.apiKey = api_key
+        return True
+
+    def _login(self, url: str, json_payload: dict, deadline: float | None = None) -> dict:
+        """Protected function shared by all login methods: sends credentials and stores the returned API key.
+        :param url: request URL
+        :param json_payload: `requests` json payload.
+        :param deadline: time budget in seconds for the whole call
         :return: response as dictionary
         """
-        response = requests.post(url, json=json_payload, headers={'X-Auth-Token': self.apiKey})
-        _check_response(response)
-        return response.json()
+        content = self._stored_login(url, json_payload)
+        if content is not None:
+            return content
+        content = self._post_with_retries(url, json_payload, auth=False, expiry=self._expiry(url, deadline))
+        self.apiKey = content['data']
+        self._remember_login(url, json_payload)
+        if self.loud_mode:
+            print(f'Login successful. API key: {self.apiKey}')
+        return content
+
+    def _stored_login(self, url: str, json_payload: dict) -> dict | None:
+        """Protected function to log in with a key of `session_store`. The key is not checked, an expired key is
+        renewed by the first request that is rejected.
+        :return: login response built from the stored key, None if there is no usable key
+        """
+        if self.session_store is None or self._endpoint(url) not in self.renewable_login_endpoints:
+            return None
+        api_key = self.session_store.load(self._login_identity(url, json_payload))
+        if api_key is None:
+            return None
+        self.apiKey = api_key
+        self._remember_login(url, json_payload)
+        if self.loud_mode:
+            print(f'Login skipped, stored API key: {self.apiKey}')
+        return {'requestId': None, 'version': None, 'sessionId': None, 'data': api_key, 'errorCode': None,
+                'errorMessage': None}
+
+    def _login_identity(self, url: str, json_payload: dict) -> str:
+        """Protected function to name a login in `session_store`. The hash covers the whole login payload, password or
+        token included, so that a stored key is only reused with the credentials that obtained it. The credentials
+        themselves are never stored.
+        """
+        return payload_hash({'url': url, 'payload': json_payload})
+
+    def _remember_login(self, url: str, json_payload: dict):
+        """Protected function to keep a renewable login for `_renew` and save its key in `session_store`.
+        """
+        self._cache_user = json_payload.get('username') or self.apiKey
+        if self._endpoint(url) not in self.renewable_login_endpoints:
+            self._login_request = None
+            self._session_identity = None
+            return
+        self._login_request = (url, json_payload)
+        if self.session_store is not None:
+            self._session_identity = self._login_identity(url, json_payload)
+            self.session_store.save(self._session_identity, self.apiKey)
+
+    def _forget_login(self):
+        if self._session_identity is not None:
+            self.session_store.remove(self._session_identity)
+        self._login_request = None
+        self._session_identity = None
+        self._cache_user = None
+
+    def _logout(self, url: str, deadline: float | None = None) -> dict:
+        """Protected function to destroy the current API key.
+        :param url: request URL
+        :param deadline: time budget in seconds for the whole call
+        :return: response as dictionary
+        """
+        content = self._post_with_retries(url, expiry=self._expiry(url, deadline))
+        self._forget_login()
+        if self.loud_mode:
+            print(f'Logout successful. API key destroyed: {self.apiKey}')
+        return content
 
-    def dataOwner(self, dataOwner):
+    def dataOwner(self, dataOwner, deadline=None):
         """
         This method is used to provide the contact information of the data owner.
         :param dataOwner: (string) Used to identify the data owner - this value comes from the dataset-search response
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}data-owner'
         json_payload = {"dataOwner": dataOwner}
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
-    def dataset(self, datasetId=None, datasetName=None):
+    def dataset(self, datasetId=None, datasetName=None, deadline=None):
         """
         This method is used to retrieve the dataset by id or name.
         :param datasetId: (string) The dataset identifier - must use this or datasetName
         :param datasetName: (string) The system-friendly dataset name - must use this or datasetId
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         if all(v is None for v in {datasetId, datasetName}):
@@ -56,40 +742,43 @@ class API:
         url = f'{self.apiURL}dataset'
         json_payload = {"datasetId": datasetId,
                         "datasetName": datasetName}
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
-    def datasetBrowse(self, datasetId):
+    def datasetBrowse(self, datasetId, deadline=None):
         """
         This request is used to return the browse configurations for the specified dataset.
         :param datasetId: (string) Determines which dataset to return browse configurations for
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}dataset-browse'
         json_payload = {"datasetId": datasetId}
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
-    def datasetBulkProducts(self, datasetName):
+    def datasetBulkProducts(self, datasetName, deadline=None):
         """
         Lists all available bulk products for a dataset - this does not guarantee scene availability.
         :param datasetName: (str)  	Used to identify the which dataset to return results for
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}dataset-bulk-products'
         json_payload = {"datasetName": datasetName}
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
-    def datasetCatalogs(self):
+    def datasetCatalogs(self, deadline=None):
         """
         This method is used to retrieve the available dataset catalogs. The use of dataset catalogs are not required,
         but are used to group datasets by their use within our web applications.
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}dataset-catalogs'
         json_payload = {}
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
     def datasetCategories(self, catalog, includeMessages=False, publicOnly=False, useCustomization=False, parentId=None,
-                          datasetFilter=None):
+                          datasetFilter=None, deadline=None):
         """
         This method is used to search datasets under the categories.
         :param catalog: (string) Used to identify datasets that are associated with a given application
@@ -101,6 +790,7 @@ class API:
                provided ID
         :param datasetFilter: (string) If provided, filters the datasets - this automatically adds a wildcard before and
                after the input value
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}dataset-categories'
@@ -110,14 +800,15 @@ class API:
                         "useCustomization": useCustomization,
                         "parentId": parentId,
                         "datasetFilter": datasetFilter}
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
-    def datasetClearCustomization(self, datasetName=None, metadataType=None, fileGroupIds=None):
+    def datasetClearCustomization(self, datasetName=None, metadataType=None, fileGroupIds=None, deadline=None):
         """
         This method is used the remove an entire customization or clear out a specific metadata type.
         :param datasetName: (string) Used to identify the dataset to clear. If null, all dataset customizations will be cleared.
         :param metadataType: (string[]) If populated, identifies which metadata to clear(export, full, res_sum, shp)
         :param fileGroupIds: (string[]) If populated, identifies which file group to clear
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         if fileGroupIds is None:
@@ -129,82 +820,89 @@ class API:
                         "metadataType": metadataType,
                         "fileGroupIds": fileGroupIds,
                         }
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
-    def datasetCoverage(self, datasetName):
+    def datasetCoverage(self, datasetName, deadline=None):
         """
         Returns coverage for a given dataset.
         :param datasetName: (string) Determines which dataset to return coverage for
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}dataset-coverage'
         json_payload = {"datasetName": datasetName}
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
-    def datasetDownloadOptions(self, datasetName, sceneFilter=None):
+    def datasetDownloadOptions(self, datasetName, sceneFilter=None, deadline=None):
         """
         This request lists all available products for a given dataset - this does not guarantee scene availability.
         :param datasetName: (string) Used to identify the which dataset to return results for
         :param sceneFilter: (SceneFilter) Used to filter data within the dataset
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}dataset-download-options'
         json_payload = {"datasetName": datasetName,
                         "sceneFilter": sceneFilter}
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
-    def datasetFileGroups(self, datasetName):
+    def datasetFileGroups(self, datasetName, deadline=None):
         """
         This method is used to list all configured file groups for a dataset.
         :param datasetName: (string) Dataset alias
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}dataset-file-groups'
         json_payload = {"datasetName": datasetName}
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
-    def datasetFilters(self, datasetName):
+    def datasetFilters(self, datasetName, deadline=None):
         """
         This request is used to return the metadata filter fields for the specified dataset. These values can be used
         as additional criteria when submitting search and hit queries.
         :param datasetName: (string) Determines which dataset to return filters for
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}dataset-filters'
         json_payload = {"datasetName": datasetName}
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
-    def datasetGetCustomization(self, datasetName):
+    def datasetGetCustomization(self, datasetName, deadline=None):
         """
         This method is used to retrieve metadata customization for a specific dataset.
         as additional criteria when submitting search and hit queries.
         :param datasetName: (string) Used to identify the dataset to search
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}dataset-get-customization'
         json_payload = {"datasetName": datasetName}
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
-    def datasetGetCustomizations(self, datasetNames=None, metadataType=None):
+    def datasetGetCustomizations(self, datasetNames=None, metadataType=None, deadline=None):
         """
         This method is used to retrieve metadata customizations for multiple datasets at once.
         :param datasetNames: (string[]) Used to identify the dataset(s) to return. If null it will return all the users
         customizations
         :param metadataType: (string[]) If populated, identifies which metadata to return(export, full, res_sum, shp)
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}dataset-get-customizations'
         json_payload = {"datasetName": datasetNames,
                         "metadataType": metadataType,
                         }
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
-    def datasetMessages(self, catalog=None, datasetName=None, datasetNames=None):
+    def datasetMessages(self, catalog=None, datasetName=None, datasetNames=None, deadline=None):
         """
         Returns any notices regarding the given datasets features.
         :param catalog: (string) Used to identify datasets that are associated with a given application
         :param datasetName: (string) Used as a filter with wildcards inserted at the beginning and the end of the supplied value
         :param datasetNames: (string[]) Used as a filter with wildcards inserted at the beginning and the end of the supplied value
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}dataset-messages'
@@ -212,31 +910,33 @@ class API:
                         "datasetName": datasetName,
                         "datasetNames": datasetNames,
                         }
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
-    def datasetMetadata(self, datasetName):
+    def datasetMetadata(self, datasetName, deadline=None):
         """
         This method is used to retrieve all metadata fields for a given dataset.
         :param datasetName: (string) The system-friendly dataset name
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}dataset-metadata'
         json_payload = {"datasetName": datasetName}
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
-    def datasetOrderProducts(self, datasetName):
+    def datasetOrderProducts(self, datasetName, deadline=None):
         """
         Lists all available order products for a dataset - this does not guarantee scene availability.
         :param datasetName: (string) Used to identify the which dataset to return results for
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}dataset-order-products'
         json_payload = {"datasetName": datasetName}
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
     def datasetSearch(self, catalog=None, categoryId=None, datasetName=None, includeMessages=None, publicOnly=None,
                       includeUnknownSpatial=None, temporalFilter=None, spatialFilter=None, sortDirection=None,
-                      sortField=None, useCustomization=None):
+                      sortField=None, useCustomization=None, deadline=None):
         """
         This method is used to find datasets available for searching. By passing only API Key, all available datasets
         are returned. Additional parameters such as temporal range and spatial bounding box can be used to find datasets
@@ -254,6 +954,7 @@ class API:
         :param sortField: (string) Identifies which field should be used to sort datasets (shortName - default, longName, dastasetName, GloVis)
         :param useCustomization: (string) Optional parameter to indicate whether to use customization
 
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}dataset-search'
@@ -269,9 +970,10 @@ class API:
                         "sortField": sortField,
                         "useCustomization": useCustomization,
                         }
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
-    def datasetSetCustomization(self, datasetName, excluded=None, metadata=None, searchSort=None, fileGroups=None):
+    def datasetSetCustomization(self, datasetName, excluded=None, metadata=None, searchSort=None, fileGroups=None,
+                                deadline=None):
         """
         This method is used to create or update dataset customizations for a given dataset.
         :param datasetName: (string) Used to identify the dataset to search
@@ -279,6 +981,7 @@ class API:
         :param metadata: (Metadata) Used to customize the metadata layout.
         :param searchSort: (SearchSort) Used to sort the dataset results.
         :param fileGroups: (FileGroups) Used to customize downloads by file groups
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}dataset-set-customization'
@@ -288,53 +991,57 @@ class API:
                         "searchSort": searchSort,
                         "fileGroups": fileGroups,
                         }
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
-    def datasetSetCustomizations(self, datasetCustomization):
+    def datasetSetCustomizations(self, datasetCustomization, deadline=None):
         """
         This method is used to create or update dataset customizations for a given dataset.
         :param datasetCustomization: (DatasetCustomization) Used to create or update a dataset customization for
         multiple datasets.
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}dataset-set-customizations'
         json_payload = {"datasetCustomization": datasetCustomization}
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
-    def downloadCompleteProxied(self, proxiedDownloads):
+    def downloadCompleteProxied(self, proxiedDownloads, deadline=None):
         """
         Updates status to 'C' with total downloaded file size for completed proxied downloads
         :param proxiedDownloads: (ProxiedDownload[]) Used to specify multiple proxied downloads
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}download-complete-proxied'
         json_payload = {"proxiedDownloads": proxiedDownloads}
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
-    def downloadEula(self, eulaCode=None, eulaCodes=None):
+    def downloadEula(self, eulaCode=None, eulaCodes=None, deadline=None):
         """
         Gets the contents of a EULA from the eulaCodes.
         :param eulaCode: (string) Used to specify a single eula
         :param eulaCodes: (string[]) Used to specify multiple eulas
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}download-eula'
         json_payload = {"eulaCode": eulaCode,
                         "eulaCodes": eulaCodes,
                         }
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
-    def downloadLabels(self, downloadApplication=None):
+    def downloadLabels(self, downloadApplication=None, deadline=None):
         """
         Gets a list of unique download labels associated with the orders.
         :param downloadApplication: (string) Used to denote the application that will perform the download
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}download-labels'
         json_payload = {"downloadApplication": downloadApplication}
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
-    def downloadOptions(self, datasetName, entityIds=None, listId=None, includeSecondaryFileGroups=None):
+    def downloadOptions(self, datasetName, entityIds=None, listId=None, includeSecondaryFileGroups=None, deadline=None):
         """
         The download options request is used to discover downloadable products for each dataset. If a download is marked
         as not available, an order must be placed to generate that product.
@@ -342,6 +1049,7 @@ class API:
         :param entityIds: (str) List of scenes
         :param listId: (str) Used to identify the list of scenes to use
         :param includeSecondaryFileGroups: (boolean) Optional parameter to return file group IDs with secondary products
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}download-options'
@@ -350,26 +1058,28 @@ class API:
                         "listId": listId,
                         "includeSecondaryFileGroups": includeSecondaryFileGroups,
                         }
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
-    def downloadOrderLoad(self, downloadApplication=None, label=None):
+    def downloadOrderLoad(self, downloadApplication=None, label=None, deadline=None):
         """
         This method is used to prepare a download order for processing by moving the scenes into the queue for processing
         :param downloadApplication: (string) Used to denote the application that will perform the download
         :param label: (string) Determines which order to load
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}download-order-load'
         json_payload = {"downloadApplication": downloadApplication,
                         "label": label,
                         }
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
-    def downloadOrderRemove(self, label, downloadApplication=None):
+    def downloadOrderRemove(self, label, downloadApplication=None, deadline=None):
         """
         This method is used to remove an order from the download queue.
         :param downloadApplication: (string) Used to denote the application that will perform the download
         :param label: (string) Determines which order to remove
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
 
@@ -377,21 +1087,22 @@ class API:
         json_payload = {"downloadApplication": downloadApplication,
                         "label": label,
                         }
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
-    def downloadRemove(self, downloadId):
+    def downloadRemove(self, downloadId, deadline=None):
         """
         Removes an item from the download queue.
         :param downloadId: (int) Represents the ID of the download from within the queue
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}download-remove'
         json_payload = {"downloadId": downloadId,
                         }
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
     def downloadRequest(self, configurationCode=None, downloadApplication=None, downloads=None, dataPaths=None,
-                        label=None, systemId=None, dataGroups=None, returnAvailable=False):
+                        label=None, systemId=None, dataGroups=None, returnAvailable=False, deadline=None):
         """
         This method is used to insert the requested downloads into the download queue and returns the available download
         URLs.
@@ -433,6 +1144,7 @@ this error will stop occuring and download requests will succeed.
         :param systemId: (string) Identifies the system submitting the download/order (default = M2M). Internal use only
         :param dataGroups: (FilegroupDownload[]) Identifies the products by file groups
         :param returnAvailable: THIS MAY BE UNDOCUMENTED PARAMETER
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}download-request'
@@ -445,9 +1157,9 @@ this error will stop occuring and download requests will succeed.
                         "dataGroups": dataGroups,
                         "returnAvailable": returnAvailable,  # this may be undocumented parameter
                         }
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
-    def downloadRetrieve(self, downloadApplication=None, label=None):
+    def downloadRetrieve(self, downloadApplication=None, label=None, deadline=None):
         """
         Returns all available and previously requests but not completed downloads.
 
@@ -456,20 +1168,22 @@ by those systems will not appear as available nor are they counted in the 'queue
 
         :param downloadApplication: (string) Used to denote the application that will perform the download
         :param label: (string) Determines which downloads to return
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}download-retrieve'
         json_payload = {"label": label,
                         "downloadApplication": downloadApplication,
                         }
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
-    def downloadSearch(self, activeOnly=None, label=None, downloadApplication=None):
+    def downloadSearch(self, activeOnly=None, label=None, downloadApplication=None, deadline=None):
         """
         This method is used to searche for downloads within the queue, regardless of status, that match the given label.
         :param activeOnly: (boolean) Determines if completed, failed, cleared and proxied downloads are returned
         :param label: (string) Used to filter downloads by label
         :param downloadApplication: (string) Used to filter downloads by the intended downloading application
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}download-search'
@@ -477,14 +1191,15 @@ by those systems will not appear as available nor are they counted in the 'queue
                         "label": label,
                         "downloadApplication": downloadApplication,
                         }
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
-    def downloadSummary(self, downloadApplication, label, sendEmail=None):
+    def downloadSummary(self, downloadApplication, label, sendEmail=None, deadline=None):
         """
         Gets a summary of all downloads, by dataset, for any matching labels.
         :param downloadApplication: (string) Used to denote the application that will perform the download
         :param label: (string) Determines which downloads to return
         :param sendEmail: (boolean) If set to true, a summary email will also be sent
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}download-summary'
@@ -492,15 +1207,16 @@ by those systems will not appear as available nor are they counted in the 'queue
                         "label": label,
                         "sendEmail": sendEmail,
                         }
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
-    def grid2ll(self, gridType, responseShape=None, path=None, row=None):
+    def grid2ll(self, gridType, responseShape=None, path=None, row=None, deadline=None):
         """
         Used to translate between known grids and coordinates.
         :param gridType: (string) Which grid system is being used? (WRS1 or WRS2)
         :param responseShape: (string) What type of geometry should be returned - a bounding box polygon or a center point? (polygon or point)
         :param path: (string) The x coordinate in the grid system
         :param row: (string) The y coordinate in the grid system
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}grid2ll'
@@ -509,9 +1225,9 @@ by those systems will not appear as available nor are they counted in the 'queue
                         "path": path,
                         "row": row,
                         }
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
-    def login(self, username, password, userContext=None):
+    def login(self, username, password, userContext=None, deadline=None):
         """
         Upon a successful login, an API key will be returned. This key will be active for two hours and should be
         destroyed upon final use of the service by calling the logout method. This request requires an HTTP POST
@@ -520,6 +1236,7 @@ by those systems will not appear as available nor are they counted in the 'queue
         :param username: (string) ERS Username
         :param password: (string) ERS Password
         :param userContext: (UserContext) Metadata describing the user the request is on behalf of
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         warn("The `login` endpoint will be deprecated in February 2025. To continue using the API, use the "
@@ -532,14 +1249,9 @@ by those systems will not appear as available nor are they counted in the 'queue
                         "password": password,
                         "userContext": userContext,
                         }
-        response = requests.post(url, json=json_payload)
-        _check_response(response)
-        self.apiKey = response.json()['data']
-        if self.loud_mode:
-            print(f'Login successful. API key: {self.apiKey}')
-        return response.json()
+        return self._login(url, json_payload, deadline=deadline)
 
-    def loginAppGuest(self, applicationToken, userToken):
+    def loginAppGuest(self, applicationToken, userToken, deadline=None):
         """
         This endpoint assumes that the calling application has generated a single-use token to complete the
         authentication and return an API Key specific to that guest user. All subsequent requests should use the API
@@ -551,20 +1263,16 @@ by those systems will not appear as available nor are they counted in the 'queue
         sent from the assumed application.
         :param applicationToken: (string) The token for the calling application
         :param userToken: (string) The single-use token generated for this user
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}login-app-guest'
         json_payload = {"applicationToken": applicationToken,
                         "userToken": userToken,
                         }
-        response = requests.post(url, json=json_payload)
-        _check_response(response)
-        self.apiKey = response.json()['data']
-        if self.loud_mode:
-            print(f'Login successful. API key: {self.apiKey}')
-        return response.json()
+        return self._login(url, json_payload, deadline=deadline)
 
-    def loginSSO(self, userContext):
+    def loginSSO(self, userContext, deadline=None):
         """
         This endpoint assumes that a user has an active ERS Single Sign-On Cookie in their browser or attached to this
         request. Authentication will be performed from the Single Sign-On Cookie and return an API Key upon successful
@@ -573,18 +1281,14 @@ by those systems will not appear as available nor are they counted in the 'queue
         restarted after each subsequent request, and should be destroyed upon final use of the service by calling the
         logout method.
         :param userContext: (UserContext) Metadata describing the user the request is on behalf of
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}login-sso'
         json_payload = {"userContext": userContext}
-        response = requests.post(url, json=json_payload)
-        _check_response(response)
-        self.apiKey = response.json()['data']
-        if self.loud_mode:
-            print(f'Login successful. API key: {self.apiKey}')
-        return response.json()
+        return self._login(url, json_payload, deadline=deadline)
 
-    def loginToken(self, username, token):
+    def loginToken(self, username, token, deadline=None):
         """
         This login method uses ERS application tokens to allow for authentication that is not directly tied the users
         ERS password. Instructions for generating the application token can be found here:
@@ -596,42 +1300,36 @@ by those systems will not appear as available nor are they counted in the 'queue
         username and password information from being logged by firewalls, web servers, etc.
         :param username: (string) ERS Username
         :param token: (string) Application Token
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}login-token'
         json_payload = {"username": username,
                         "token": token,
                         }
-        response = requests.post(url, json=json_payload)
-        _check_response(response)
-        self.apiKey = response.json()['data']
-        if self.loud_mode:
-            print(f'Login successful. API key: {self.apiKey}')
-        return response.json()
+        return self._login(url, json_payload, deadline=deadline)
 
-    def logout(self):
+    def logout(self, deadline=None):
         """
         This method is used to remove the users API key from being used in the future.
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}logout'
-        response = requests.post(url, headers={'X-Auth-Token': self.apiKey})
-        _check_response(response)
-        if self.loud_mode:
-            print(f'Logout successful. API key destroyed: {self.apiKey}')
-        return response.json()
+        return self._logout(url, deadline=deadline)
 
-    def notifications(self, systemId):
+    def notifications(self, systemId, deadline=None):
         """
         Gets a notification list. Note: Few valid systems ids are BDA, DDS, EE, ERS, GVN, HDDS, M2M, etc.
         :param systemId: (string) Determines the system you wish to return notifications for
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}notifications'
         json_payload = {"systemId": systemId}
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
-    def orderProducts(self, datasetName, entityIds=None, listId=None):
+    def orderProducts(self, datasetName, entityIds=None, listId=None, deadline=None):
         """
         Gets a list of currently selected products - paginated.
         Note: "listId" is the id of the customized list which is built by scene-list-add:
@@ -639,6 +1337,7 @@ by those systems will not appear as available nor are they counted in the 'queue
         :param datasetName: (string) Dataset alias
         :param entityIds: (string) List of scenes
         :param listId: (string) Used to identify the list of scenes to use
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}order-products'
@@ -646,10 +1345,10 @@ by those systems will not appear as available nor are they counted in the 'queue
                         "entityIds": entityIds,
                         "listId": listId,
                         }
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
     def orderSubmit(self, products, autoBulkOrder=None, processingParameters=None, priority=None,
-                    orderComment=None, systemId=None):
+                    orderComment=None, systemId=None, deadline=None):
         """
         Submits the current product list as a TRAM order - internally calling tram-order-create.
         :param products: (Product[]) Used to identify higher level products that this data may be used to create
@@ -659,6 +1358,7 @@ by those systems will not appear as available nor are they counted in the 'queue
         :param priority: (int) Processing Priority
         :param orderComment: (string) Optional textual identifier for the order
         :param systemId: (string) Identifies the system submitting the order
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}order-submit'
@@ -669,32 +1369,34 @@ by those systems will not appear as available nor are they counted in the 'queue
                         "orderComment": orderComment,
                         "systemId": systemId,
                         }
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
-    def permissions(self):
+    def permissions(self, deadline=None):
         """
         Returns a list of user permissions for the authenticated user. This method does not accept any input.
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}permissions'
         json_payload = {}
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
     # Perhaps the feature description is not yet complete? https://m2m.cr.usgs.gov/api/docs/reference/#placename
-    def placename(self, featureType=None, name=None):
+    def placename(self, featureType=None, name=None, deadline=None):
         """
         (Description Unavailable)
         :param featureType: (string) Type or feature - either US or world
         :param name: (string) Name of the feature
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}placename'
         json_payload = {"featureType": featureType,
                         "name": name,
                         }
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
-    def rateLimitSummary(self, ipAddress=None):
+    def rateLimitSummary(self, ipAddress=None, deadline=None):
         """
         Returns download rate limits and how many downloads are in each status as well as how close the user is to
         reaching the rate limits
@@ -724,14 +1426,15 @@ error when requesting products that belong to any of these systems: 'This downlo
 Please try again at a later time. We apologize for the inconvenience.'. Once the distribution system is back online,
 this error will stop occuring and download requests will succeed.
         :param ipAddress: (string[])  	Used to specify multiple IP address
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}rate-limit-summary'
         json_payload = {"ipAddress": ipAddress}
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
     def sceneListAdd(self, listId, datasetName, idField=None, entityId=None, entityIds=None, timeToLive=None,
-                     checkDownloadRestriction=None):
+                     checkDownloadRestriction=None, deadline=None):
         """
         Adds items in the given scene list.
         :param listId: (string) User defined name for the list
@@ -741,6 +1444,7 @@ this error will stop occuring and download requests will succeed.
         :param entityIds: (string[]) A list of Scene Indentifiers
         :param timeToLive: (string) User defined lifetime using ISO-8601 formatted duration (such as "P1M") for the list
         :param checkDownloadRestriction: (boolean) Optional parameter to check download restricted access and availability
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
 
@@ -753,15 +1457,16 @@ this error will stop occuring and download requests will succeed.
                         "timeToLive": timeToLive,
                         "checkDownloadRestriction": checkDownloadRestriction,
                         }
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
-    def sceneListGet(self, listId, datasetName=None, startingNumber=None, maxResults=None):
+    def sceneListGet(self, listId, datasetName=None, startingNumber=None, maxResults=None, deadline=None):
         """
         Returns items in the given scene list.
         :param listId: (string) User defined name for the list
         :param datasetName: (string) Dataset alias
         :param startingNumber: (int) Used to identify the start number to search from
         :param maxResults: (int) How many results should be returned?
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}scene-list-get'
@@ -770,9 +1475,9 @@ this error will stop occuring and download requests will succeed.
                         "startingNumber": startingNumber,
                         "maxResults": maxResults,
                         }
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
-    def sceneListRemove(self, listId, datasetName=None, entityId=None, entityIds=None):
+    def sceneListRemove(self, listId, datasetName=None, entityId=None, entityIds=None, deadline=None):
         """
         Removes items from the given list. If no datasetName is provided, the call removes the whole list. If a
         datasetName is provided but no entityId, this call removes that dataset with all its IDs. If a datasetName and
@@ -781,6 +1486,7 @@ this error will stop occuring and download requests will succeed.
         :param datasetName: (string) Dataset alias
         :param entityId: (string) Scene Indentifier
         :param entityIds: (string[]) A list of Scene Indentifiers
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}scene-list-remove'
@@ -789,33 +1495,35 @@ this error will stop occuring and download requests will succeed.
                         "entityId": entityId,
                         "entityIds": entityIds,
                         }
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
-    def sceneListSummary(self, listId, datasetName=None):
+    def sceneListSummary(self, listId, datasetName=None, deadline=None):
         """
         Returns summary information for a given list.
         :param listId: (string) User defined name for the list
         :param datasetName: (string) Dataset alias
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}scene-list-summary'
         json_payload = {"listId": listId,
                         "datasetName": datasetName,
                         }
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
-    def sceneListTypes(self, listFilter=None):
+    def sceneListTypes(self, listFilter=None, deadline=None):
         """
         Returns scene list types (exclude, search, order, bulk, etc).
         :param listFilter: (string) If provided, only returns listIds that have the provided filter value within the ID
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}scene-list-types'
         json_payload = {"listFilter": listFilter}
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
     def sceneMetadata(self, datasetName, entityId, idType=None, metadataType=None, includeNullMetadataValues=None,
-                      useCustomization=None):
+                      useCustomization=None, deadline=None):
         """
         This request is used to return metadata for a given scene.
         :param datasetName: (string) Used to identify the dataset to search
@@ -825,6 +1533,7 @@ this error will stop occuring and download requests will succeed.
         :param metadataType: (string) If populated, identifies which metadata to return (summary, full, fgdc, iso)
         :param includeNullMetadataValues: (boolean) Optional parameter to include null metadata values
         :param useCustomization: (boolean) Optional parameter to display metadata view as per user customization
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}scene-metadata'
@@ -835,10 +1544,10 @@ this error will stop occuring and download requests will succeed.
                         "includeNullMetadataValues": includeNullMetadataValues,
                         "useCustomization": useCustomization,
                         }
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
     def sceneMetadataList(self, listId, datasetName=None, metadataType=None, includeNullMetadataValues=None,
-                          useCustomization=None):
+                          useCustomization=None, deadline=None):
         """
         Scene Metadata where the input is a pre-set list.
         :param datasetName: (string) Used to identify the dataset to search
@@ -846,6 +1555,7 @@ this error will stop occuring and download requests will succeed.
         :param metadataType: (string) If populated, identifies which metadata to return (summary or full)
         :param includeNullMetadataValues: (boolean) Optional parameter to include null metadata values
         :param useCustomization: (boolean) Optional parameter to display metadata view as per user customization
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}scene-metadata-list'
@@ -855,14 +1565,15 @@ this error will stop occuring and download requests will succeed.
                         "includeNullMetadataValues": includeNullMetadataValues,
                         "useCustomization": useCustomization,
                         }
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
-    def sceneMetadataXML(self, datasetName, entityId, metadataType=None):
+    def sceneMetadataXML(self, datasetName, entityId, metadataType=None, deadline=None):
         """
         Returns metadata formatted in XML, ahering to FGDC, ISO and EE scene metadata formatting standards.
         :param datasetName: (string) Used to identify the dataset to search
         :param entityId: (string) Used to identify the scene to return results for
         :param metadataType: (string) If populated, identifies which metadata to return (full, fgdc, iso)
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}scene-metadata-xml'
@@ -870,12 +1581,12 @@ this error will stop occuring and download requests will succeed.
                         "entityId": entityId,
                         "metadataType": metadataType,
                         }
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
     def sceneSearch(self, datasetName, maxResults=None, startingNumber=None, metadataType=None, sortField=None,
                     sortDirection=None, sortCustomization=None, useCustomization=None, sceneFilter=None,
                     compareListName=None, bulkListName=None, orderListName=None, excludeListName=None,
-                    includeNullMetadataValues=None):
+                    includeNullMetadataValues=None, deadline=None):
         """
         Searching is done with limited search criteria. All coordinates are assumed decimal-degree format. If lowerLeft
         or upperRight are supplied, then both must exist in the request to complete the bounding box. Starting and
@@ -909,28 +1620,37 @@ this error will stop occuring and download requests will succeed.
         :param orderListName: (string) If provided, defined a scene-list listId to use to track scenes selected for on-demand ordering
         :param excludeListName: (string) If provided, defined a scene-list listId to use to exclude scenes from the results
         :param includeNullMetadataValues: (boolean) Optional parameter to include null metadata values
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}scene-search'
-        json_payload = {"datasetName": datasetName,
-                        "maxResults": maxResults,
-                        "startingNumber": startingNumber,
-                        "metadataType": metadataType,
-                        "sortField": sortField,
-                        "sortDirection": sortDirection,
-                        "sortCustomization": sortCustomization,
-                        "useCustomization": useCustomization,
-                        "sceneFilter": sceneFilter,
-                        "compareListName": compareListName,
-                        "bulkListName": bulkListName,
-                        "orderListName": orderListName,
-                        "excludeListName": excludeListName,
-                        "includeNullMetadataValues": includeNullMetadataValues,
-                        }
-        return self.__send_request_and_check_it(url, json_payload)
+        json_payload = self._scene_search_payload(datasetName, maxResults, startingNumber, metadataType, sortField,
+                                                  sortDirection, sortCustomization, useCustomization, sceneFilter,
+                                                  compareListName, bulkListName, orderListName, excludeListName,
+                                                  includeNullMetadataValues)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
+
+    def sceneSearchStream(self, datasetName, maxResults=None, startingNumber=None, metadataType=None, sortField=None,
+                          sortDirection=None, sortCustomization=None, useCustomization=None, sceneFilter=None,
+                          compareListName=None, bulkListName=None, orderListName=None, excludeListName=None,
+                          includeNullMetadataValues=None, deadline=None):
+        """
+        Same as `sceneSearch`, but the response is parsed while it is downloaded: the scenes are yielded one at a time
+        and memory use does not grow with `maxResults`. The other response fields (totalHits, nextRecord, ...) are
+        attributes of the returned stream, see `ResultsStream`. Close the stream (or use it as a context manager) if
+        the iteration is stopped early.
+        :param deadline: (float) Time budget in seconds until the first scene is received, retries included
+        :return: (ResultsStream) Iterator over the scenes of `data.results`
+        """
+        url = f'{self.apiURL}scene-search'
+        json_payload = self._scene_search_payload(datasetName, maxResults, startingNumber, metadataType, sortField,
+                                                  sortDirection, sortCustomization, useCustomization, sceneFilter,
+                                                  compareListName, bulkListName, orderListName, excludeListName,
+                                                  includeNullMetadataValues)
+        return self._stream_request(url, json_payload, deadline=deadline)
 
     def sceneSearchDelete(self, datasetName, maxResults=None, startingNumber=None, sortField=None, sortDirection=None,
-                          temporalFilter=None):
+                          temporalFilter=None, deadline=None):
         """
         This method is used to detect deleted scenes from datasets that support it. Supported datasets are determined by
         the 'supportDeletionSearch' parameter in the 'datasets' response. There currently is a 50,000 scene limit for
@@ -942,6 +1662,7 @@ this error will stop occuring and download requests will succeed.
         :param sortField: (string) Determines which field to sort the results on
         :param sortDirection: (string) Determines how the results should be sorted - ASC or DESC
         :param temporalFilter: (TemporalFilter) Used to filter data based on data acquisition
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}scene-search-delete'
@@ -952,11 +1673,11 @@ this error will stop occuring and download requests will succeed.
                         "sortDirection": sortDirection,
                         "temporalFilter": temporalFilter
                         }
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
     def sceneSearchSecondary(self, entityId, datasetName, maxResults=None, startingNumber=None, metadataType=None,
                              sortField=None, sortDirection=None, compareListName=None, bulkListName=None,
-                             orderListName=None, excludeListName=None):
+                             orderListName=None, excludeListName=None, deadline=None):
         """
         This method is used to find the related scenes for a given scene.
         :param entityId: (string) Used to identify the scene to find related scenes for
@@ -970,6 +1691,7 @@ this error will stop occuring and download requests will succeed.
         :param bulkListName: (string) If provided, defined a scene-list listId to use to track scenes selected for bulk ordering
         :param orderListName: (string) If provided, defined a scene-list listId to use to track scenes selected for on-demand ordering
         :param excludeListName: (string) If provided, defined a scene-list listId to use to exclude scenes from the results
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}scene-search-secondary'
@@ -986,58 +1708,62 @@ this error will stop occuring and download requests will succeed.
                         "excludeListName": excludeListName,
 
                         }
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
-    def tramOrderDetailUpdate(self, orderNumber, detailKey, detailValue):
+    def tramOrderDetailUpdate(self, orderNumber, detailKey, detailValue, deadline=None):
         """
         This method is used to set metadata for an order.
         :param orderNumber: (string) The order ID for the order to update
         :param detailKey: (string) The system detail key
         :param detailValue: (string) The value to store under the detailKey
-         :return: (dict) Response as a dictionary
+         :param deadline: (float) Time budget in seconds for the whole call, retries included
+        :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}tram-order-detail-update'
         json_payload = {"orderNumber": orderNumber,
                         "detailKey": detailKey,
                         "detailValue": detailValue,
                         }
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
-    def tramOrderDetails(self, orderNumber):
+    def tramOrderDetails(self, orderNumber, deadline=None):
         """
         This method is used to set metadata for an order.
         :param orderNumber: (string) The order ID to get details for
-         :return: (dict) Response as a dictionary
+         :param deadline: (float) Time budget in seconds for the whole call, retries included
+        :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}tram-order-details'
         json_payload = {"orderNumber": orderNumber}
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
-    def tramOrderDetailsClear(self, orderNumber):
+    def tramOrderDetailsClear(self, orderNumber, deadline=None):
         """
         This method is used to clear all metadata within an order.
         :param orderNumber: (string) The order ID to clear details for
-         :return: (dict) Response as a dictionary
+         :param deadline: (float) Time budget in seconds for the whole call, retries included
+        :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}tram-order-details-clear'
         json_payload = {"orderNumber": orderNumber}
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
-    def tramOrderDetailsRemove(self, orderNumber, detailKey):
+    def tramOrderDetailsRemove(self, orderNumber, detailKey, deadline=None):
         """
         This method is used to clear all metadata within an order.
         :param orderNumber: (string) The order ID to clear details for
         :param detailKey: (string) The system detail key
-         :return: (dict) Response as a dictionary
+         :param deadline: (float) Time budget in seconds for the whole call, retries included
+        :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}tram-order-details-remove'
         json_payload = {"orderNumber": orderNumber,
                         "detailKey": detailKey,
                         }
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
     def tramOrderSearch(self, orderId=None, maxResults=None, systemId=None, sortAsc=None, sortField=None,
-                        statusFilter=None):
+                        statusFilter=None, deadline=None):
         """
         Search TRAM orders.
         :param orderId: (string) The order ID to get status for (accepts '%' wildcard)
@@ -1046,6 +1772,7 @@ this error will stop occuring and download requests will succeed.
         :param sortAsc: (boolean) True for ascending results, false for descending results
         :param sortField: (string) Which field should sorting be done on? (order_id, date_entered or date_updated)
         :param statusFilter: (string[]) An array of status codes to
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}tram-order-search'
@@ -1056,51 +1783,55 @@ this error will stop occuring and download requests will succeed.
                         "sortField": sortField,
                         "statusFilter": statusFilter,
                         }
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
-    def tramOrderStatus(self, orderNumber):
+    def tramOrderStatus(self, orderNumber, deadline=None):
         """
         Gets the status of a TRAM order.
         :param orderNumber: (string) The order ID to get status for
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}tram-order-status'
         json_payload = {"orderNumber": orderNumber}
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
-    def tramOrderUnits(self, orderNumber):
+    def tramOrderUnits(self, orderNumber, deadline=None):
         """
         Lists units for a specified order.
         :param orderNumber: (string) The order ID to get units for
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}tram-order-units'
         json_payload = {"orderNumber": orderNumber}
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
-    def userPreferenceGet(self, systemId=None, setting=None):
+    def userPreferenceGet(self, systemId=None, setting=None, deadline=None):
         """
         This method is used to retrieve user's preference settings.
         :param systemId: (string) Used to identify which system to return preferences for. If null it will return all
                                      the users preferences
         :param setting: (string[]) If populated, identifies which setting(s) to return
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}user-preference-get'
         json_payload = {"systemId": systemId,
                         "setting": setting,
                         }
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)
 
-    def userPreferenceSet(self, systemId, userPreferences):
+    def userPreferenceSet(self, systemId, userPreferences, deadline=None):
         """
         This method is used to create or update user's preferences.
         :param systemId: (string) Used to identify which system the preferences are for.
         :param userPreferences: (string[]) Used to set user preferences for various systems.
+        :param deadline: (float) Time budget in seconds for the whole call, retries included
         :return: (dict) Response as a dictionary
         """
         url = f'{self.apiURL}user-preference-set'
         json_payload = {"systemId": systemId,
                         "userPreferences": userPreferences,
                         }
-        return self.__send_request_and_check_it(url, json_payload)
+        return self._send_request_and_check_it(url, json_payload, deadline=deadline)